@@ -1,9 +1,10 @@
 import sys
 import os
-from flask import Blueprint, Flask, request, jsonify, send_file
+from flask import Blueprint, Flask, Response, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
 import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
 from uuid import uuid4
@@ -11,15 +12,44 @@ from typing import Dict, List, Optional, Union
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.os_manager import ChromeType
 import base64
+import atexit
 
 # Import scrapers
-from backend.scrapers.bing import scrape_bing
-from backend.scrapers.amazon import scrape_amazon
-from backend.scrapers.flipkart import scrape_flipkart
-from backend.scrapers.mdcomputers import scrape_mdcomputers
+from backend.scrapers.bing import parse_bing_html, scrape_bing, search_url as bing_search_url
+from backend.scrapers.amazon import (
+    amazon_tab_job, parse_amazon_html, scrape_amazon, scrape_amazon_http, search_url as amazon_search_url
+)
+from backend.scrapers.flipkart import (
+    flipkart_tab_job, parse_flipkart_html, scrape_flipkart, scrape_flipkart_http, search_url as flipkart_search_url
+)
+from backend.scrapers.mdcomputers import (
+    mdcomputers_tab_job, parse_mdcomputers_html, scrape_mdcomputers, scrape_mdcomputers_http,
+    search_url as mdcomputers_search_url
+)
+from backend.scrapers.runner import SiteResult, iter_site_results
+from backend.scrapers.categories import classify_many
+from backend.scrapers.prices import price_fields
+from backend.scrapers.tabs import scrape_in_tabs
+from backend.scrapers.driver_pool import DriverPool
+from backend.scrapers.chromedriver import resolve_chromedriver
+from backend.scrapers.cache import SearchCache, normalize_query
+from backend.scrapers.tiers import TierStats
+from backend.scrapers.engine import ScrapeEngine, SiteSpec
+from backend.scrapers.session import configure_http
+from backend.scrapers.blocking import BlockStats, apply_block_profile, configure_options
+from backend.scrapers.breaker import BreakerRegistry
+from backend.prices.store import PriceStore
+from backend.prices.refresher import PriceRefresher
+from backend.prices.trends import price_trend
+from backend.prices.grouping import group_products
+from backend.catalog.catalog import ComponentCatalog
+from backend.catalog.index import SORTS as COMPONENT_SORTS
+from backend.catalog.importer import (
+    FORMATS as IMPORT_FORMATS, MATCH_MODES as IMPORT_MATCH_MODES,
+    MERGE_POLICIES as IMPORT_MERGE_POLICIES, import_rows, iter_csv, iter_json, iter_ndjson
+)
+from backend.catalog.storage import JsonComponentStorage, SqliteComponentStorage
 
 # Configure logging
 logging.basicConfig(
@@ -56,7 +86,8 @@ CORS(app, resources={
     r"/api/*": {
         "origins": renderer_url,
         "supports_credentials": True,
-        "allow_headers": ["Content-Type", "Authorization"],
+        "allow_headers": ["Content-Type", "Authorization", "If-None-Match"],
+        "expose_headers": ["ETag"],
         "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
     }
 })
@@ -256,9 +287,90 @@ QUOTATIONS_DIR.mkdir(exist_ok=True)
 
 # Constants
 COMPONENTS_FILE = Path(resource_path('backend/data/components.json'))
+# Where the component catalog is persisted: "sqlite" (one row per component,
+# imported once from COMPONENTS_FILE) or "json" (COMPONENTS_FILE rewritten on
+# every change). The catalog lives in memory; storage is re-read only when
+# another process changes it, checked at most this often (seconds)
+COMPONENT_STORAGE = "sqlite"
+COMPONENTS_DB_FILE = DATA_DIR / 'components.sqlite3'
+COMPONENT_FILE_CHECK_INTERVAL = 1.0
+# /api/components pages: without a limit the whole (filtered) catalog is returned
+COMPONENT_PAGE_MAX = 200
+# Changes kept for /api/components/changes; older clients are told to re-fetch
+COMPONENT_CHANGE_LOG_SIZE = 10000
+# Bulk imports are validated and committed this many rows at a time; only the
+# first IMPORT_MAX_ERRORS row errors are listed in the report
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_ERRORS = 100
 MAX_SEARCH_RESULTS = 50
+CHROMEDRIVER_VERSION = "138.0.7204.184"
+CHROMEDRIVER_MANIFEST = DATA_DIR / 'chromedriver_manifest.json'
+PAGE_LOAD_STRATEGY = "eager"
 DEFAULT_HEADLESS = True
 
+# Per-site and overall deadlines (seconds) for a multi-site search
+SITE_TIMEOUTS = {
+    "bing": 15,
+    "amazon": 30,
+    "flipkart": 35,
+    "mdcomputers": 30
+}
+SEARCH_TIMEOUT = 40
+
+# Per-seller circuit breakers: trip when most recent scrapes fail, skip the seller
+# for a cooldown, then let one probe through. Deadlines shrink towards the observed
+# p95 latency (times a headroom factor) but never exceed SITE_TIMEOUTS.
+BREAKER_WINDOW = 20
+BREAKER_MIN_CALLS = 5
+BREAKER_FAILURE_THRESHOLD = 0.6
+BREAKER_COOLDOWN = 120
+ADAPTIVE_TIMEOUT_FACTOR = 1.5
+ADAPTIVE_TIMEOUT_MIN = 5
+
+# How Selenium sellers share browsers: "parallel" runs every seller on the async
+# engine with its own pooled driver as fallback, "tabs" scrapes them all from one
+# driver with a tab per seller (less RAM)
+SEARCH_STRATEGIES = ("parallel", "tabs")
+SEARCH_STRATEGY = "parallel"
+
+# Warm Chrome drivers shared by the Selenium scrapers
+DRIVER_POOL_SIZE = 3
+DRIVER_MAX_USES = 50
+DRIVER_MAX_HEAP_MB = 512
+
+# Search result cache: freshness per seller (seconds) and size bounds
+SEARCH_CACHE_TTL = {
+    "bing": 600,
+    "amazon": 900,
+    "flipkart": 900,
+    "mdcomputers": 1800
+}
+SEARCH_CACHE_PARTIAL_TTL = 60
+SEARCH_CACHE_MAX_ENTRIES = 256
+SEARCH_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Every scrape is recorded in a local price database; /api/search answers from
+# it when a seller's stored results are younger than PRICE_STORE_MAX_AGE. Watched
+# queries (and, optionally, every catalog component, which is what feeds the
+# component price history) are re-scraped in the background once they are older
+# than PRICE_REFRESH_INTERVAL, stalest first and at most PRICE_REFRESH_MAX_PER_PASS
+# per check, so a large catalog is spread over many checks and shares the driver
+# pool with users.
+PRICE_DB_FILE = DATA_DIR / 'prices.sqlite3'
+PRICE_STORE_MAX_AGE = 3600
+PRICE_REFRESH_INTERVAL = 6 * 3600
+PRICE_REFRESH_CHECK_EVERY = 300
+PRICE_REFRESH_CONCURRENCY = 2
+PRICE_REFRESH_MAX_PER_PASS = 5
+PRICE_WATCH_COMPONENTS = True
+
+# Price history: every observation is kept for PRICE_HISTORY_RAW_DAYS, then
+# merged into one point per product per day, and dropped after the retention
+PRICE_HISTORY_RAW_DAYS = 2
+PRICE_HISTORY_RETENTION_DAYS = 365
+PRICE_TREND_DAYS = 30
+PRICE_TREND_WINDOW = 7
+
 class Component:
     """Component data model with validation"""
     def __init__(self, data: Dict):
@@ -274,7 +386,10 @@ class Component:
             raise ValueError("Invalid price format")
         self.warranty: str = data.get('warranty', '')
         self.created_at: str = data.get('created_at', datetime.now().isoformat())
-        self.updated_at: str = datetime.now().isoformat()
+        self.updated_at: str = data.get('updated_at', self.created_at)
+        for field in ('id', 'category', 'name', 'brand', 'warranty', 'created_at', 'updated_at'):
+            if not isinstance(getattr(self, field), str):
+                raise ValueError(f"{field} must be a string")
 
     def to_dict(self) -> Dict:
         return {
@@ -293,6 +408,10 @@ def init_driver():
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    # Scrapers only read text and links: skip images, fonts, stylesheets and trackers
+    configure_options(options)
+    # Return from driver.get() at DOMContentLoaded; scrapers wait for their own results
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
     
     # For Electron bundled app
     if getattr(sys, 'frozen', False):
@@ -302,10 +421,7 @@ def init_driver():
     else:
         # For development
         service = Service(
-            ChromeDriverManager(
-                chrome_type=ChromeType.GOOGLE,
-                driver_version="138.0.7204.184"
-            ).install()
+            executable_path=resolve_chromedriver(CHROMEDRIVER_VERSION, CHROMEDRIVER_MANIFEST)
         )
 
     try:
@@ -315,59 +431,74 @@ def init_driver():
         logger.error(f"Failed to initialize ChromeDriver: {str(e)}")
         raise
 
-def load_components() -> List[Dict]:
-    """Load components from JSON file with error handling"""
-    try:
-        if not COMPONENTS_FILE.exists():
-            return []
-        
-        with open(COMPONENTS_FILE, 'r') as f:
-            components = json.load(f)
-            return [Component(comp).to_dict() for comp in components]
-            
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in components file: {str(e)}")
-        return []
-    except Exception as e:
-        logger.error(f"Error loading components: {str(e)}")
-        return []
+driver_pool = DriverPool(
+    init_driver,
+    size=DRIVER_POOL_SIZE,
+    max_uses=DRIVER_MAX_USES,
+    max_heap_mb=DRIVER_MAX_HEAP_MB
+)
+atexit.register(driver_pool.close)
 
-def save_components(components: List[Dict]) -> bool:
-    """Save components to JSON file with error handling"""
-    try:
-        COMPONENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(COMPONENTS_FILE, 'w') as f:
-            json.dump(components, f, indent=2)
-        return True
-    except Exception as e:
-        logger.error(f"Error saving components: {str(e)}")
-        return False
+search_cache = SearchCache(
+    max_entries=SEARCH_CACHE_MAX_ENTRIES,
+    max_bytes=SEARCH_CACHE_MAX_BYTES
+)
 
-def detect_category(title: str) -> str:
-    """Detect component category from product title"""
-    if not title:
-        return "Other"
-    
-    lower_title = title.lower()
-    
-    category_mapping = {
-        "CPU": ['i3', 'i5', 'i7', 'i9', 'ryzen', 'core', 'pentium', 'celeron', 'xeon'],
-        "GPU": ['rtx', 'gtx', 'radeon', 'arc', 'gpu', 'graphics card'],
-        "RAM": ['ddr3', 'ddr4', 'ddr5', 'ram', 'memory'],
-        "Motherboard": ['motherboard', 'mainboard', 'h61', 'b450', 'x570', 'z690'],
-        "Storage": ['ssd', 'nvme', 'hdd', 'hard disk', 'm.2'],
-        "PSU": ['psu', 'power supply', 'smps'],
-        "Case": ['case', 'chassis', 'cabinet'],
-        "Cooling": ['cooler', 'aio', 'fan', 'heatsink'],
-        "Monitor": ['monitor', 'display', 'screen'],
-        "Accessories": ['keyboard', 'mouse', 'headset']
-    }
-    
-    for category, terms in category_mapping.items():
-        if any(term in lower_title for term in terms):
-            return category
-    
-    return "Other"
+tier_stats = TierStats()
+block_stats = BlockStats()
+site_breakers = BreakerRegistry(
+    SITE_TIMEOUTS,
+    default_max_timeout=SEARCH_TIMEOUT,
+    min_timeout=ADAPTIVE_TIMEOUT_MIN,
+    timeout_factor=ADAPTIVE_TIMEOUT_FACTOR,
+    window=BREAKER_WINDOW,
+    min_calls=BREAKER_MIN_CALLS,
+    failure_threshold=BREAKER_FAILURE_THRESHOLD,
+    cooldown=BREAKER_COOLDOWN
+)
+
+price_store = PriceStore(
+    PRICE_DB_FILE,
+    raw_retention=PRICE_HISTORY_RAW_DAYS * 86400,
+    history_retention=PRICE_HISTORY_RETENTION_DAYS * 86400
+)
+atexit.register(price_store.close)
+
+# HTTP settings for the requests-based scrapers (Bing and the static fetch tier)
+app.config.setdefault('SCRAPER_HTTP_CONNECT_TIMEOUT', 5.0)
+app.config.setdefault('SCRAPER_HTTP_READ_TIMEOUT', 15.0)
+app.config.setdefault('SCRAPER_HTTP_POOL_SIZE', 20)
+app.config.setdefault('SCRAPER_HTTP_RETRIES', 1)
+
+def configure_scraper_http():
+    """Apply the SCRAPER_HTTP_* app config to the shared scraper session"""
+    configure_http(
+        connect_timeout=app.config['SCRAPER_HTTP_CONNECT_TIMEOUT'],
+        read_timeout=app.config['SCRAPER_HTTP_READ_TIMEOUT'],
+        pool_maxsize=app.config['SCRAPER_HTTP_POOL_SIZE'],
+        max_retries=app.config['SCRAPER_HTTP_RETRIES']
+    )
+
+configure_scraper_http()
+
+def validate_component(data: Dict) -> Dict:
+    return Component(data).to_dict()
+
+def open_component_storage():
+    """Storage backend named by COMPONENT_STORAGE; SQLite imports components.json on first use"""
+    if COMPONENT_STORAGE == "json":
+        return JsonComponentStorage(COMPONENTS_FILE)
+    storage = SqliteComponentStorage(COMPONENTS_DB_FILE)
+    storage.import_json(COMPONENTS_FILE, validate_component)
+    return storage
+
+component_catalog = ComponentCatalog(
+    open_component_storage(),
+    validate=validate_component,
+    check_interval=COMPONENT_FILE_CHECK_INTERVAL,
+    max_changes=COMPONENT_CHANGE_LOG_SIZE
+)
+atexit.register(component_catalog.storage.close)
 
 # ====================== Quotation History Endpoints ======================
 
@@ -562,6 +693,330 @@ def delete_quotation(quotation_id):
 
 # ====================== Existing Endpoints ======================
 
+# Structured price fields on every search result: "price" is a number in rupees
+# (None when the listing showed no price), "price_paise" the exact integer amount
+PRICE_FIELDS = ("price", "price_paise", "currency", "price_present", "price_raw")
+SEARCH_SORTS = ("relevance", "price_asc", "price_desc")
+
+SITE_LABELS = {
+    "bing": "Bing Shopping",
+    "amazon": "Amazon",
+    "flipkart": "Flipkart",
+    "mdcomputers": "MD Computers"
+}
+
+def result_price(product: Dict) -> Dict:
+    """Structured price fields of a scraped product; re-parses raw prices from older scrapes"""
+    if "price_present" in product:
+        return {field: product.get(field) for field in PRICE_FIELDS}
+    return price_fields(product.get("price"))
+
+def normalize_results(site: str, products: List[Dict], limit: int) -> List[Dict]:
+    """Map a scraper's raw products onto the common search result shape"""
+    if site == "bing":
+        products = products[:limit]
+        categories = classify_many(p.get("name", "") for p in products)
+        return [
+            {
+                "title": p.get("name", ""),
+                **result_price(p),
+                "link": p.get("link", "#"),
+                "site": SITE_LABELS[site],
+                "seller": p.get("seller", ""),
+                "category": category
+            }
+            for p, category in zip(products, categories)
+        ]
+
+    return [
+        {
+            "title": p.get("title", ""),
+            **result_price(p),
+            "link": p.get("link", "#"),
+            "site": SITE_LABELS[site],
+            "brand": p.get("brand", ""),
+            "category": p.get("category", "")
+        }
+        for p in products[:limit]
+    ]
+
+def with_driver(scrape, site: Optional[str] = None):
+    """Wrap a Selenium scraper so it runs on a driver checked out of the pool"""
+    def job():
+        with driver_pool.driver() as driver:
+            if site is None:
+                return scrape(driver)
+            apply_block_profile(driver, site)
+            try:
+                return scrape(driver)
+            finally:
+                block_stats.collect(driver, site)
+    return job
+
+def browser_fallback(site: str, scrape):
+    """Blocking Selenium scrape on a pooled driver, for the engine's browser executor.
+
+    The results wait is bounded by the seller's adaptive browser-tier timeout,
+    so an abandoned scrape hands its driver back to the pool soon after the
+    site's deadline.
+    """
+    def run(query: str, limit: int):
+        timeout = site_breakers.get(site).timeout("browser")
+        return with_driver(lambda driver: scrape(driver, query, limit, timeout), site)()
+    return run
+
+scrape_engine = ScrapeEngine(
+    {
+        "bing": SiteSpec(bing_search_url, lambda html, limit: parse_bing_html(html)),
+        "amazon": SiteSpec(
+            amazon_search_url,
+            parse_amazon_html,
+            browser_fallback("amazon", lambda driver, query, limit, timeout: scrape_amazon(driver, query, timeout=timeout))
+        ),
+        "flipkart": SiteSpec(
+            flipkart_search_url,
+            parse_flipkart_html,
+            browser_fallback("flipkart", lambda driver, query, limit, timeout: scrape_flipkart(driver, query, timeout=timeout))
+        ),
+        "mdcomputers": SiteSpec(
+            mdcomputers_search_url,
+            parse_mdcomputers_html,
+            browser_fallback(
+                "mdcomputers",
+                lambda driver, query, limit, timeout: scrape_mdcomputers(query, limit, driver=driver, timeout=timeout)
+            )
+        )
+    },
+    tier_stats,
+    browser_workers=DRIVER_POOL_SIZE,
+    connect_timeout=app.config['SCRAPER_HTTP_CONNECT_TIMEOUT'],
+    read_timeout=app.config['SCRAPER_HTTP_READ_TIMEOUT'],
+    max_connections=app.config['SCRAPER_HTTP_POOL_SIZE']
+)
+atexit.register(scrape_engine.close)
+
+def parse_sellers(seller: str) -> List[str]:
+    """Turn the seller parameter ("all", "amazon" or "amazon,flipkart") into known site keys"""
+    requested = [name.strip() for name in seller.lower().split(",") if name.strip()]
+    if not requested or "all" in requested:
+        return list(SITE_LABELS)
+    return [site for site in SITE_LABELS if site in requested]
+
+def build_static_jobs(query: str, sellers: List[str], limit: int) -> Dict:
+    """Browser-free scrape jobs: Bing plus the static HTTP tier of the other sellers"""
+    jobs = {
+        "bing": lambda: scrape_bing(query),
+        "amazon": lambda: scrape_amazon_http(query),
+        "flipkart": lambda: scrape_flipkart_http(query),
+        "mdcomputers": lambda: scrape_mdcomputers_http(query, limit)
+    }
+    return {
+        site: job for site, job in jobs.items()
+        if site in sellers and (site == "bing" or tier_stats.prefer_http(site))
+    }
+
+def build_tab_jobs(query: str, sellers: List[str], limit: int) -> Dict:
+    jobs = {
+        "amazon": lambda: amazon_tab_job(query),
+        "flipkart": lambda: flipkart_tab_job(query),
+        "mdcomputers": lambda: mdcomputers_tab_job(query, limit)
+    }
+    return {site: make_job() for site, make_job in jobs.items() if site in sellers}
+
+def iter_tabbed_search(query: str, sellers: List[str], limit: int, site_timeouts: Dict[str, float]):
+    """Static fetches first, then one pooled browser with a tab per seller still missing results"""
+    started = time.monotonic()
+    static_jobs = build_static_jobs(query, sellers, limit)
+    need_browser = [site for site in sellers if site not in static_jobs]
+
+    for site_result in iter_site_results(static_jobs, site_timeouts, SEARCH_TIMEOUT):
+        site_result.tier = "http"
+        if site_result.site == "bing":
+            yield site_result
+            continue
+        tier_stats.record(site_result.site, "http", bool(site_result.results))
+        if site_result.results:
+            yield site_result
+        else:
+            need_browser.append(site_result.site)
+
+    tab_jobs = build_tab_jobs(query, need_browser, limit)
+    if not tab_jobs:
+        return
+
+    with driver_pool.driver() as driver:
+        for site_result in scrape_in_tabs(
+            driver,
+            tab_jobs,
+            {site: min(site_timeouts.get(site, SEARCH_TIMEOUT), SEARCH_TIMEOUT) for site in tab_jobs},
+            prepare=apply_block_profile,
+            started=started
+        ):
+            site_result.tier = "browser"
+            tier_stats.record(site_result.site, "browser", bool(site_result.results))
+            yield site_result
+        block_stats.collect(driver, "tabs")
+
+def parse_strategy(strategy: Optional[str]) -> str:
+    strategy = (strategy or SEARCH_STRATEGY).lower()
+    return strategy if strategy in SEARCH_STRATEGIES else SEARCH_STRATEGY
+
+def search_cache_key(query: str, sellers: List[str], limit: int):
+    return ("search", normalize_query(query), tuple(sellers), limit)
+
+def search_cache_ttl(sellers: List[str], sites: Dict) -> float:
+    """How long a search result may be served from cache.
+
+    Results answered from the price store are already ``stored_age`` old, so
+    their seller's TTL is shortened by that much; otherwise a cache hit would
+    pass off hour-old prices as fresh.
+    """
+    if any(summary["error"] for summary in sites.values()):
+        return SEARCH_CACHE_PARTIAL_TTL
+    return max(0, min(
+        SEARCH_CACHE_TTL.get(site, SEARCH_CACHE_PARTIAL_TTL) - (sites.get(site, {}).get("stored_age") or 0)
+        for site in sellers
+    ))
+
+def iter_live_search(query: str, sellers: List[str], limit: int, strategy: str = SEARCH_STRATEGY):
+    """Yield (site, normalized results, summary) for each seller as soon as it finishes"""
+    allowed = []
+    for site in sellers:
+        breaker = site_breakers.get(site)
+        if breaker.allow():
+            allowed.append(site)
+            continue
+        skipped = SiteResult(
+            site,
+            error=f"{SITE_LABELS[site]} is failing; skipped for another {breaker.retry_in():.0f}s",
+            skipped=True
+        )
+        yield site, [], skipped.summary()
+
+    if not allowed:
+        return
+
+    site_timeouts = site_breakers.timeouts({site: scrape_engine.tiers(site) for site in allowed})
+    if strategy == "tabs":
+        site_results = iter_tabbed_search(query, allowed, limit, site_timeouts)
+    else:
+        site_results = scrape_engine.iter_search_sync(query, allowed, limit, site_timeouts, SEARCH_TIMEOUT)
+
+    for site_result in site_results:
+        # A page that loaded but had no hits is not a failure; only its latency isn't sampled
+        site_breakers.get(site_result.site).record(
+            not site_result.error,
+            site_result.elapsed if site_result.results else None,
+            site_result.tier or "http"
+        )
+        normalized = normalize_results(site_result.site, site_result.results, limit)
+        try:
+            price_store.record_search(normalize_query(query), site_result.site, normalized, site_result.error,
+                                      max_results=limit)
+        except Exception as e:
+            logger.error(f"Error recording {site_result.site} prices: {str(e)}")
+        yield site_result.site, normalized, site_result.summary()
+
+def iter_search_results(query: str, sellers: List[str], limit: int, strategy: str = SEARCH_STRATEGY,
+                        max_age: float = PRICE_STORE_MAX_AGE):
+    """Like ``iter_live_search``, but sellers with fresh enough stored results skip the scrape"""
+    remaining = []
+    for site in sellers:
+        stored = price_store.lookup(normalize_query(query), site, max_age, limit) if max_age > 0 else None
+        if stored is None:
+            remaining.append(site)
+            continue
+        site_results, age = stored
+        summary = SiteResult(site, results=site_results).summary()
+        yield site, site_results, {**summary, "stored": True, "stored_age": round(age, 1)}
+
+    if remaining:
+        for site, site_results, summary in iter_live_search(query, remaining, limit, strategy):
+            yield site, site_results, {**summary, "stored": False, "stored_age": None}
+
+def collect_search_results(sellers: List[str], items) -> tuple:
+    """Merge iter_search_results items into (cache value, cache ttl)"""
+    results = []
+    sites = {}
+    for site, site_results, summary in items:
+        results.extend(site_results)
+        sites[site] = summary
+
+    ttl = search_cache_ttl(sellers, sites) if results else 0
+    return {"results": results, "sites": sites}, ttl
+
+def run_search(query: str, sellers: List[str], limit: int, strategy: str = SEARCH_STRATEGY,
+               max_age: float = PRICE_STORE_MAX_AGE):
+    """Scrape every requested seller concurrently; returns (value, cache ttl)"""
+    # Sellers are scraped concurrently; results are merged as they finish
+    return collect_search_results(sellers, iter_search_results(query, sellers, limit, strategy, max_age))
+
+def parse_result_refinement():
+    """(sort, min_price, max_price) from the query string; raises ValueError if malformed"""
+    sort = request.args.get("sort", "relevance").lower()
+    if sort not in SEARCH_SORTS:
+        raise ValueError(f"sort must be one of {', '.join(SEARCH_SORTS)}")
+    try:
+        min_price = float(request.args["min_price"]) if request.args.get("min_price") else None
+        max_price = float(request.args["max_price"]) if request.args.get("max_price") else None
+    except ValueError:
+        raise ValueError("min_price and max_price must be numbers")
+    return sort, min_price, max_price
+
+def refine_results(results: List[Dict], sort: str = "relevance",
+                   min_price: Optional[float] = None, max_price: Optional[float] = None) -> List[Dict]:
+    """Filter results by price and sort them; listings without a price are dropped by a
+    price filter and sorted last"""
+    if min_price is not None or max_price is not None:
+        results = [
+            r for r in results
+            if r.get("price") is not None
+            and (min_price is None or r["price"] >= min_price)
+            and (max_price is None or r["price"] <= max_price)
+        ]
+    if sort != "relevance":
+        priced = [r for r in results if r.get("price") is not None]
+        unpriced = [r for r in results if r.get("price") is None]
+        results = sorted(priced, key=lambda r: r["price"], reverse=sort == "price_desc") + unpriced
+    return results
+
+def is_flag_set(name: str) -> bool:
+    return request.args.get(name, "").lower() in ("1", "true", "yes")
+
+def is_refresh_requested() -> bool:
+    return is_flag_set("refresh")
+
+def watched_queries() -> List[Dict]:
+    """Queries the background refresher keeps fresh: the watchlist plus catalog components"""
+    entries = {entry["query"]: entry for entry in price_store.watched()}
+    if PRICE_WATCH_COMPONENTS:
+        for component in component_catalog.list():
+            query = normalize_query(component["name"])
+            entries.setdefault(query, {"query": query, "sellers": list(SITE_LABELS)})
+    return list(entries.values())
+
+def refresh_query(query: str, sellers: List[str]):
+    """Live-scrape a query for the refresher; iter_live_search records the results"""
+    for _ in iter_live_search(query, sellers, MAX_SEARCH_RESULTS):
+        pass
+
+price_refresher = PriceRefresher(
+    price_store,
+    refresh_query,
+    watched_queries,
+    interval=PRICE_REFRESH_INTERVAL,
+    check_every=PRICE_REFRESH_CHECK_EVERY,
+    concurrency=PRICE_REFRESH_CONCURRENCY,
+    max_per_pass=PRICE_REFRESH_MAX_PER_PASS,
+    maintenance=price_store.compact
+)
+atexit.register(price_refresher.stop)
+
+@app.before_request
+def start_price_refresher():
+    """Start the refresher in whichever process serves requests: dev server, reloader child or WSGI worker"""
+    price_refresher.start()
+
 @app.route("/api/bing-search", methods=["GET"])
 def bing_search():
     """Search products on Bing Shopping"""
@@ -577,9 +1032,18 @@ def bing_search():
         })
         return add_cors_headers(response), 400
 
+    def scrape():
+        # Format results consistently with other scrapers
+        formatted = normalize_results("bing", scrape_bing(query), limit)
+        return formatted, SEARCH_CACHE_TTL["bing"] if formatted else 0
+
     try:
-        results = scrape_bing(query)
-        if not results:
+        formatted_results, cached, age = search_cache.get_or_compute(
+            ("bing-search", normalize_query(query), limit),
+            scrape,
+            refresh=is_refresh_requested()
+        )
+        if not formatted_results:
             response = jsonify({
                 "success": False,
                 "error": "No results found",
@@ -587,22 +1051,12 @@ def bing_search():
             })
             return add_cors_headers(response), 404
 
-        # Format results consistently with other scrapers
-        formatted_results = []
-        for product in results[:limit]:
-            formatted_results.append({
-                "title": product.get("name", ""),
-                "price": product.get("price", 0),
-                "link": product.get("link", "#"),
-                "site": "Bing Shopping",
-                "seller": product.get("seller", ""),
-                "category": detect_category(product.get("name", ""))
-            })
-
         response = jsonify({
             "success": True,
             "count": len(formatted_results),
-            "results": formatted_results
+            "results": formatted_results,
+            "cached": cached,
+            "cache_age": round(age, 1)
         })
         return add_cors_headers(response)
 
@@ -631,100 +1085,48 @@ def search():
         })
         return add_cors_headers(response), 400
 
-    driver = None
+    sellers = parse_sellers(seller)
+    strategy = parse_strategy(request.args.get("strategy"))
+    refresh = is_refresh_requested()
     try:
-        results = []
-        
-        # Scrape Bing if requested (doesn't need Selenium)
-        if seller in ["all", "bing"]:
-            try:
-                bing_results = scrape_bing(query)
-                results.extend([
-                    {
-                        "title": p.get("name", ""),
-                        "price": p.get("price", 0),
-                        "link": p.get("link", "#"),
-                        "site": "Bing Shopping",
-                        "seller": p.get("seller", ""),
-                        "category": detect_category(p.get("name", ""))
-                    }
-                    for p in bing_results[:limit]
-                ])
-            except Exception as e:
-                logger.error(f"Bing scrape failed: {str(e)}")
-
-        # Scrape other sites with Selenium if requested
-        if seller in ["all", "amazon", "flipkart", "mdcomputers"]:
-            driver = init_driver()
-            
-            if seller in ["all", "amazon"]:
-                try:
-                    amazon_results = scrape_amazon(driver, query)
-                    if amazon_results:
-                        results.extend([
-                            {
-                                "title": p.get("title", ""),
-                                "price": p.get("price", 0),
-                                "link": p.get("link", "#"),
-                                "site": "Amazon",
-                                "brand": p.get("brand", ""),
-                                "category": p.get("category", "")
-                            }
-                            for p in amazon_results[:limit]
-                        ])
-                except Exception as e:
-                    logger.error(f"Amazon scrape failed: {str(e)}")
-
-            if seller in ["all", "flipkart"]:
-                try:
-                    flipkart_results = scrape_flipkart(driver, query)
-                    if flipkart_results:
-                        results.extend([
-                            {
-                                "title": p.get("title", ""),
-                                "price": p.get("price", 0),
-                                "link": p.get("link", "#"),
-                                "site": "Flipkart",
-                                "brand": p.get("brand", ""),
-                                "category": p.get("category", "")
-                            }
-                            for p in flipkart_results[:limit]
-                        ])
-                except Exception as e:
-                    logger.error(f"Flipkart scrape failed: {str(e)}")
-
-            if seller in ["all", "mdcomputers"]:
-                try:
-                    mdcomputers_results = scrape_mdcomputers(driver, query)
-                    if mdcomputers_results:
-                        results.extend([
-                            {
-                                "title": p.get("title", ""),
-                                "price": p.get("price", 0),
-                                "link": p.get("link", "#"),
-                                "site": "MD Computers",
-                                "brand": p.get("brand", ""),
-                                "category": p.get("category", "")
-                            }
-                            for p in mdcomputers_results[:limit]
-                        ])
-                except Exception as e:
-                    logger.error(f"MD Computers scrape failed: {str(e)}")
+        sort, min_price, max_price = parse_result_refinement()
+    except ValueError as e:
+        response = jsonify({"success": False, "error": str(e), "code": "INVALID_FILTER"})
+        return add_cors_headers(response), 400
+
+    try:
+        value, cached, age = search_cache.get_or_compute(
+            search_cache_key(query, sellers, limit),
+            lambda: run_search(query, sellers, limit, strategy, 0 if refresh else PRICE_STORE_MAX_AGE),
+            refresh=refresh
+        )
+        results, sites = value["results"], value["sites"]
 
         if not results:
             response = jsonify({
                 "success": False,
                 "error": "No results found",
                 "query": query,
-                "seller": seller
+                "seller": seller,
+                "sites": sites
             })
             return add_cors_headers(response), 404
 
-        response = jsonify({
+        # Filtering and sorting happen per request; the cache keeps every result
+        refined = refine_results(results, sort, min_price, max_price)
+        body = {
             "success": True,
-            "count": len(results),
-            "results": results
-        })
+            "count": len(refined),
+            "total": len(results),
+            "results": refined,
+            "sites": sites,
+            "cached": cached,
+            "cache_age": round(age, 1)
+        }
+        if is_flag_set("group"):
+            # Same product listed by several sellers: cheapest offer first
+            body["groups"] = group_products(refined)
+        response = jsonify(body)
         return add_cors_headers(response)
 
     except Exception as e:
@@ -735,29 +1137,195 @@ def search():
             "details": str(e)
         })
         return add_cors_headers(response), 500
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception as e:
-                logger.error(f"Error quitting driver: {str(e)}")
 
-@app.route('/api/components', methods=['GET'])
-def get_components():
-    """Get all saved components with optional filtering"""
+def stored_search_events(value: Dict, sellers: List[str], refine):
+    """Per-seller "results" events for a finished search (cached or shared)"""
+    for site in sellers:
+        if site not in value["sites"]:
+            continue
+        yield {
+            "type": "results",
+            "site": site,
+            "results": refine([r for r in value["results"] if r["site"] == SITE_LABELS[site]]),
+            **value["sites"][site]
+        }
+
+def search_summary_event(value: Dict, refine, started: float, group: bool, cached: bool, age: float) -> Dict:
+    refined = refine(value["results"])
+    summary = {
+        "type": "summary",
+        "count": len(refined),
+        "total": len(value["results"]),
+        "sites": value["sites"],
+        "elapsed": round(time.monotonic() - started, 3),
+        "cached": cached,
+        "cache_age": round(age, 1)
+    }
+    if group:
+        summary["groups"] = group_products(refined)
+    return summary
+
+def iter_search_events(query: str, sellers: List[str], limit: int, refresh: bool = False,
+                       strategy: str = SEARCH_STRATEGY, group: bool = False, refine=None):
+    """Search events for streaming: one "results" event per seller, then a "summary".
+
+    ``refine(results)`` filters and orders the results sent to the client (the
+    cache keeps them unrefined). With ``group`` the summary also carries the
+    cross-seller product groups.
+    """
+    refine = refine or (lambda results: results)
+    started = time.monotonic()
+    key = search_cache_key(query, sellers, limit)
+    hit = None if refresh else search_cache.get(key)
+
+    if hit is not None:
+        value, age = hit
+        yield from stored_search_events(value, sellers, refine)
+        yield search_summary_event(value, refine, started, group, cached=True, age=age)
+        return
+
+    max_age = 0 if refresh else PRICE_STORE_MAX_AGE
+    value = None
+    items = []
+    # Identical searches already running (streamed or not) are joined instead of scraped again
+    for kind, payload in search_cache.stream_or_compute(
+        key,
+        lambda: iter_search_results(query, sellers, limit, strategy, max_age),
+        lambda items: collect_search_results(sellers, items)
+    ):
+        if kind == "value":
+            value = payload
+            yield from stored_search_events(value, sellers, refine)
+        else:
+            items.append(payload)
+            site, site_results, summary = payload
+            yield {"type": "results", "site": site, "results": refine(site_results), **summary}
+
+    if value is None:
+        value, _ = collect_search_results(sellers, items)
+    yield search_summary_event(value, refine, started, group, cached=False, age=0.0)
+
+@app.route("/api/search/stream", methods=["GET"])
+def search_stream():
+    """Stream each seller's results as soon as its scraper finishes.
+
+    Sends newline-delimited JSON by default, or Server-Sent Events when the
+    client asks for text/event-stream (or passes format=sse).
+    """
+    query = request.args.get("query", "").strip()
+    sellers = parse_sellers(request.args.get("seller", "all"))
+    limit = int(request.args.get("limit", MAX_SEARCH_RESULTS))
+    refresh = is_refresh_requested()
+    group = is_flag_set("group")
+    strategy = parse_strategy(request.args.get("strategy"))
     try:
-        category = request.args.get('category')
-        components = load_components()
-        
-        if category:
-            components = [c for c in components if c['category'].lower() == category.lower()]
-        
+        sort, min_price, max_price = parse_result_refinement()
+    except ValueError as e:
+        response = jsonify({"success": False, "error": str(e), "code": "INVALID_FILTER"})
+        return add_cors_headers(response), 400
+    use_sse = (
+        request.args.get("format") == "sse"
+        or "text/event-stream" in request.headers.get("Accept", "")
+    )
+
+    # Validate input
+    if not query or len(query) < 2:
         response = jsonify({
-            "success": True,
-            "count": len(components),
-            "components": components
+            "success": False,
+            "error": "Query must be at least 2 characters",
+            "code": "QUERY_TOO_SHORT"
         })
+        return add_cors_headers(response), 400
+
+    def encode(event: Dict) -> str:
+        payload = json.dumps(event)
+        if use_sse:
+            return f"event: {event['type']}\ndata: {payload}\n\n"
+        return payload + "\n"
+
+    def generate():
+        try:
+            for event in iter_search_events(
+                query, sellers, limit, refresh, strategy, group,
+                refine=lambda results: refine_results(results, sort, min_price, max_price)
+            ):
+                yield encode(event)
+        except Exception as e:
+            logger.error(f"Search stream error: {str(e)}", exc_info=True)
+            yield encode({"type": "error", "error": "Search failed", "details": str(e)})
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream" if use_sse else "application/x-ndjson"
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return add_cors_headers(response)
+
+def parse_component_query() -> Dict:
+    """Keyword arguments for ComponentCatalog.search from the query string; raises ValueError"""
+    sort = request.args.get("sort", "catalog").lower()
+    if sort not in COMPONENT_SORTS:
+        raise ValueError(f"sort must be one of {', '.join(COMPONENT_SORTS)}")
+    category = request.args.get("category")
+    try:
+        min_price = float(request.args["min_price"]) if request.args.get("min_price") else None
+        max_price = float(request.args["max_price"]) if request.args.get("max_price") else None
+    except ValueError:
+        raise ValueError("min_price and max_price must be numbers")
+    try:
+        limit = int(request.args["limit"]) if request.args.get("limit") else None
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit is not None and not 1 <= limit <= COMPONENT_PAGE_MAX:
+        raise ValueError(f"limit must be between 1 and {COMPONENT_PAGE_MAX}")
+    return {
+        "text": request.args.get("search") or None,
+        "category": category if category and category.lower() != "all" else None,
+        "brand": request.args.get("brand") or None,
+        "min_price": min_price,
+        "max_price": max_price,
+        "sort": sort,
+        "limit": limit,
+        "cursor": request.args.get("cursor") or None
+    }
+
+@app.route('/api/components', methods=['GET'])
+def get_components():
+    """Search, filter, sort and page the saved components.
+
+    Responses carry the catalog revision as their ETag; a request whose
+    If-None-Match still matches gets 304 without the catalog being searched.
+    """
+    try:
+        query = parse_component_query()
+    except ValueError as e:
+        response = jsonify({"success": False, "error": str(e), "code": "INVALID_FILTER"})
+        return add_cors_headers(response), 400
+
+    try:
+        revision = component_catalog.revision
+        etag = f"catalog-{revision}"
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            components, total, next_cursor = component_catalog.search(**query)
+            response = jsonify({
+                "success": True,
+                "revision": revision,
+                "count": len(components),
+                "total": total,
+                "next_cursor": next_cursor,
+                "components": components
+            })
+        response.set_etag(etag)
+        # Let browsers keep the response but revalidate it every time
+        response.headers["Cache-Control"] = "no-cache"
         return add_cors_headers(response)
+    except ValueError as e:
+        # Stale or malformed cursor
+        response = jsonify({"success": False, "error": str(e), "code": "INVALID_FILTER"})
+        return add_cors_headers(response), 400
     except Exception as e:
         logger.error(f"Error getting components: {str(e)}")
         response = jsonify({
@@ -766,6 +1334,23 @@ def get_components():
         })
         return add_cors_headers(response), 500
 
+@app.route('/api/components/changes', methods=['GET'])
+def get_component_changes():
+    """Ids added, updated and deleted since a catalog revision, with the current records"""
+    try:
+        since = int(request.args["since"])
+    except (KeyError, ValueError):
+        response = jsonify({"success": False, "error": "since must be a catalog revision"})
+        return add_cors_headers(response), 400
+
+    try:
+        response = jsonify({"success": True, "since": since, **component_catalog.changes_since(since)})
+        return add_cors_headers(response)
+    except Exception as e:
+        logger.error(f"Error loading component changes: {str(e)}")
+        response = jsonify({"success": False, "error": "Failed to load changes", "details": str(e)})
+        return add_cors_headers(response), 500
+
 @app.route('/api/components', methods=['POST'])
 def create_component():
     """Add a new component"""
@@ -799,13 +1384,15 @@ def create_component():
             })
             return add_cors_headers(response), 400
 
-        # Create and save component
-        component = Component(data).__dict__
-        components = load_components()
-        components.append(component)
-        
-        if not save_components(components):
-            raise RuntimeError("Failed to save components")
+        # Create and save component; the id is always assigned here, so a POST never replaces one
+        now = datetime.now().isoformat()
+        data = {field: value for field, value in data.items() if field != 'id'}
+        try:
+            component = Component({**data, 'created_at': now, 'updated_at': now}).to_dict()
+        except ValueError as e:
+            response = jsonify({"error": "Invalid component", "details": str(e)})
+            return add_cors_headers(response), 400
+        component = component_catalog.create(component)
         
         response = jsonify({
             "success": True,
@@ -830,30 +1417,36 @@ def update_component(component_id):
             response = jsonify({"error": "No data provided"})
             return add_cors_headers(response), 400
 
-        components = load_components()
-        updated = False
-        
-        for i, comp in enumerate(components):
-            if comp['id'] == component_id:
-                # Preserve created_at, update other fields
-                data['created_at'] = comp['created_at']
-                components[i] = Component(data).__dict__
-                updated = True
-                break
-        
-        if not updated:
+        existing = component_catalog.get(component_id)
+        if existing is None:
             response = jsonify({
                 "error": "Component not found",
                 "component_id": component_id
             })
             return add_cors_headers(response), 404
-            
-        if not save_components(components):
-            raise RuntimeError("Failed to save components")
-        
+
+        # Preserve id and created_at, update other fields
+        try:
+            component = Component({
+                **data,
+                'id': component_id,
+                'created_at': existing['created_at'],
+                'updated_at': datetime.now().isoformat()
+            }).to_dict()
+        except (KeyError, ValueError) as e:
+            response = jsonify({"error": "Invalid component", "details": str(e)})
+            return add_cors_headers(response), 400
+        component = component_catalog.update(component_id, component)
+        if component is None:
+            response = jsonify({
+                "error": "Component not found",
+                "component_id": component_id
+            })
+            return add_cors_headers(response), 404
+
         response = jsonify({
             "success": True,
-            "component": components[i]
+            "component": component
         })
         return add_cors_headers(response)
     except Exception as e:
@@ -868,20 +1461,13 @@ def update_component(component_id):
 def delete_component(component_id):
     """Delete a component"""
     try:
-        components = load_components()
-        original_count = len(components)
-        components = [c for c in components if c['id'] != component_id]
-        
-        if len(components) == original_count:
+        if not component_catalog.delete(component_id):
             response = jsonify({
                 "error": "Component not found",
                 "component_id": component_id
             })
             return add_cors_headers(response), 404
-            
-        if not save_components(components):
-            raise RuntimeError("Failed to save components")
-        
+
         response = jsonify({
             "success": True,
             "message": "Component deleted successfully"
@@ -895,6 +1481,169 @@ def delete_component(component_id):
         })
         return add_cors_headers(response), 500
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Scraper infrastructure metrics"""
+    response = jsonify({
+        "driver_pool": driver_pool.stats(),
+        "search_cache": search_cache.stats(),
+        "fetch_tiers": tier_stats.stats(),
+        "resource_blocking": block_stats.stats(),
+        "circuit_breakers": site_breakers.stats(list(SITE_LABELS)),
+        "price_store": price_store.stats(),
+        "price_refresher": price_refresher.stats(),
+        "component_catalog": component_catalog.stats(),
+        "timestamp": datetime.now().isoformat()
+    })
+    return add_cors_headers(response)
+
+@app.route('/api/prices/watch', methods=['GET'])
+def get_price_watchlist():
+    """Queries re-scraped in the background"""
+    try:
+        response = jsonify({
+            "success": True,
+            "watchlist": price_store.watched(),
+            "components": PRICE_WATCH_COMPONENTS,
+            "interval": PRICE_REFRESH_INTERVAL
+        })
+        return add_cors_headers(response)
+    except Exception as e:
+        logger.error(f"Error loading price watchlist: {str(e)}")
+        response = jsonify({"success": False, "error": "Failed to load watchlist", "details": str(e)})
+        return add_cors_headers(response), 500
+
+@app.route('/api/prices/watch', methods=['POST'])
+def add_price_watch():
+    """Add a query to the background refresh list"""
+    data = request.get_json(silent=True) or {}
+    query = normalize_query(str(data.get("query", "")))
+    if len(query) < 2:
+        response = jsonify({
+            "success": False,
+            "error": "Query must be at least 2 characters",
+            "code": "QUERY_TOO_SHORT"
+        })
+        return add_cors_headers(response), 400
+
+    sellers = parse_sellers(str(data.get("seller", "all")))
+    try:
+        price_store.watch(query, sellers)
+        price_refresher.trigger()
+        response = jsonify({"success": True, "query": query, "sellers": sellers})
+        return add_cors_headers(response), 201
+    except Exception as e:
+        logger.error(f"Error adding price watch: {str(e)}")
+        response = jsonify({"success": False, "error": "Failed to add watch", "details": str(e)})
+        return add_cors_headers(response), 500
+
+@app.route('/api/prices/watch', methods=['DELETE'])
+def remove_price_watch():
+    """Stop refreshing a query in the background"""
+    query = normalize_query(request.args.get("query", ""))
+    try:
+        if not price_store.unwatch(query):
+            response = jsonify({"success": False, "error": "Query is not watched"})
+            return add_cors_headers(response), 404
+        response = jsonify({"success": True, "query": query})
+        return add_cors_headers(response)
+    except Exception as e:
+        logger.error(f"Error removing price watch: {str(e)}")
+        response = jsonify({"success": False, "error": "Failed to remove watch", "details": str(e)})
+        return add_cors_headers(response), 500
+
+@app.route('/api/prices/refresh', methods=['POST'])
+def refresh_prices():
+    """Run a background refresh pass now"""
+    price_refresher.start()
+    price_refresher.trigger()
+    response = jsonify({"success": True, "refresher": price_refresher.stats()})
+    return add_cors_headers(response), 202
+
+def price_trend_args():
+    """(days, window) for the price history endpoints, within the stored retention"""
+    days = min(max(int(request.args.get("days", PRICE_TREND_DAYS)), 1), PRICE_HISTORY_RETENTION_DAYS)
+    window = min(max(int(request.args.get("window", PRICE_TREND_WINDOW)), 1), days)
+    return days, window
+
+@app.route('/api/prices/products', methods=['GET'])
+def find_priced_products():
+    """Stored products whose title contains the query, to look up their history"""
+    query = request.args.get("query", "").strip()
+    limit = int(request.args.get("limit", MAX_SEARCH_RESULTS))
+    try:
+        products = price_store.find_products(query, limit)
+        response = jsonify({"success": True, "count": len(products), "products": products})
+        return add_cors_headers(response)
+    except Exception as e:
+        logger.error(f"Error finding stored products: {str(e)}")
+        response = jsonify({"success": False, "error": "Failed to load products", "details": str(e)})
+        return add_cors_headers(response), 500
+
+@app.route('/api/prices/products/<int:product_id>/history', methods=['GET'])
+def get_product_price_history(product_id):
+    """Daily price history of one stored product with its min, max and moving average"""
+    try:
+        days, window = price_trend_args()
+        product = price_store.product(product_id)
+        if product is None:
+            response = jsonify({"success": False, "error": "Product not found"})
+            return add_cors_headers(response), 404
+
+        points = price_store.daily_prices([product_id], time.time() - days * 86400)
+        response = jsonify({
+            "success": True,
+            "product": product,
+            "days": days,
+            "window": window,
+            **price_trend(points, window)
+        })
+        return add_cors_headers(response)
+    except ValueError:
+        response = jsonify({"success": False, "error": "days and window must be integers"})
+        return add_cors_headers(response), 400
+    except Exception as e:
+        logger.error(f"Error loading price history for product {product_id}: {str(e)}")
+        response = jsonify({"success": False, "error": "Failed to load price history", "details": str(e)})
+        return add_cors_headers(response), 500
+
+@app.route('/api/components/<component_id>/price-history', methods=['GET'])
+def get_component_price_history(component_id):
+    """Best offer per day for a catalog component, from the offers stored for its name.
+
+    Falls back to stored products whose title contains the name when the name
+    itself has not been searched yet.
+    """
+    try:
+        days, window = price_trend_args()
+        component = component_catalog.get(component_id)
+        if component is None:
+            response = jsonify({"success": False, "error": "Component not found"})
+            return add_cors_headers(response), 404
+
+        query = normalize_query(component['name'])
+        product_ids = price_store.query_product_ids(query)
+        if not product_ids:
+            product_ids = [product["id"] for product in price_store.find_products(component['name'], MAX_SEARCH_RESULTS)]
+        points = price_store.daily_prices(product_ids, time.time() - days * 86400)
+        response = jsonify({
+            "success": True,
+            "component": component,
+            "query": query,
+            "offers": len(product_ids),
+            "days": days,
+            "window": window,
+            **price_trend(points, window, value="low")
+        })
+        return add_cors_headers(response)
+    except ValueError:
+        response = jsonify({"success": False, "error": "days and window must be integers"})
+        return add_cors_headers(response), 400
+    except Exception as e:
+        logger.error(f"Error loading price history for component {component_id}: {str(e)}")
+        response = jsonify({"success": False, "error": "Failed to load price history", "details": str(e)})
+        return add_cors_headers(response), 500
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -904,40 +1653,69 @@ def health_check():
     })
     return add_cors_headers(response)
 
+def component_import_format() -> str:
+    """"ndjson", "csv" or "json" from ?format= or the request's content type"""
+    requested = request.args.get("format", "").lower()
+    if requested:
+        if requested not in IMPORT_FORMATS:
+            raise ValueError(f"format must be one of {', '.join(IMPORT_FORMATS)}")
+        return requested
+    if request.mimetype in ("application/x-ndjson", "application/ndjson", "application/jsonl"):
+        return "ndjson"
+    if request.mimetype in ("text/csv", "application/csv"):
+        return "csv"
+    return "json"
+
 @app.route('/api/components/import', methods=['POST'])
 def import_components():
+    """Upsert components from an NDJSON or CSV stream, or a JSON {"components": [...]} body.
+
+    Rows are matched to existing components by id and/or brand+name (?match=)
+    and merged according to ?merge=; components missing from the import are kept.
+    """
     try:
-        data = request.get_json()
-        if not data or 'components' not in data:
-            response = jsonify({"success": False, "error": "No components data provided"})
-            return add_cors_headers(response), 400
-            
-        # Basic validation
-        valid_components = []
-        for comp in data['components']:
-            if all(key in comp for key in ['name', 'brand', 'price', 'category']):
-                try:
-                    # Create component with default values for missing fields
-                    component_data = {
-                        'name': comp['name'],
-                        'brand': comp['brand'],
-                        'price': float(comp['price']),
-                        'category': comp['category'],
-                        'warranty': comp.get('warranty', ''),
-                        'id': comp.get('id', str(uuid4())),
-                        'created_at': comp.get('created_at', datetime.now().isoformat())
-                    }
-                    valid_components.append(component_data)
-                except (ValueError, TypeError):
-                    continue
-        
-        # Save the validated components
-        save_components(valid_components)
-        
+        fmt = component_import_format()
+        merge = request.args.get("merge", "update").lower()
+        match = request.args.get("match", "auto").lower()
+        if merge not in IMPORT_MERGE_POLICIES:
+            raise ValueError(f"merge must be one of {', '.join(IMPORT_MERGE_POLICIES)}")
+        if match not in IMPORT_MATCH_MODES:
+            raise ValueError(f"match must be one of {', '.join(IMPORT_MATCH_MODES)}")
+    except ValueError as e:
+        response = jsonify({"success": False, "error": str(e)})
+        return add_cors_headers(response), 400
+
+    try:
+        if fmt == "json":
+            data = request.get_json(silent=True)
+            if not data or not isinstance(data.get('components'), list):
+                response = jsonify({"success": False, "error": "No components data provided"})
+                return add_cors_headers(response), 400
+            rows = iter_json(data['components'])
+        elif fmt == "csv":
+            rows = iter_csv(request.stream)
+        else:
+            rows = iter_ndjson(request.stream)
+
+        report = import_rows(
+            component_catalog, rows,
+            merge=merge,
+            match=match,
+            batch_size=IMPORT_BATCH_SIZE,
+            max_errors=IMPORT_MAX_ERRORS
+        )
+        imported = report["created"] + report["updated"]
+        logger.info(
+            f"Imported {imported} components ({report['failed']} failed) "
+            f"in {report['seconds']}s, {report['rows_per_second']} rows/s"
+        )
         response = jsonify({
             "success": True,
-            "count": len(valid_components),
-            "message": f"Imported {len(valid_components)} components"
+            "count": imported,
+            "message": f"Imported {imported} components",
+            "format": fmt,
+            "revision": component_catalog.revision,
+            **report
         })
         return add_cors_headers(response)
     except Exception as e:
@@ -1016,6 +1794,11 @@ if __name__ == "__main__":
             logger.info("ChromeDriver test successful")
         except Exception as e:
             logger.error(f"ChromeDriver initialization test failed: {str(e)}")
+
+        # Only warm browsers in the process that actually serves requests,
+        # not in the reloader's watcher process
+        if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+            driver_pool.prewarm()
         
         app.run(debug=True, port=5001, host='0.0.0.0')
         app.run(host='0.0.0.0', port=5001, debug=False, use_reloader=False)
\ No newline at end of file
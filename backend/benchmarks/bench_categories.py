@@ -0,0 +1,183 @@
+"""Compare the compiled category classifier with the per-module keyword scans it replaced.
+
+    python -m backend.benchmarks.bench_categories
+    python -m backend.benchmarks.bench_categories --titles 20000 --repeat 10
+
+Reports throughput over a title corpus built from the saved search fixtures and
+accuracy on a small hand-labelled set of typical listing titles.
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import time
+from pathlib import Path
+
+from backend.scrapers.amazon import parse_amazon_html
+from backend.scrapers.categories import classify, classify_many
+from backend.scrapers.flipkart import parse_flipkart_html
+from backend.scrapers.mdcomputers import parse_mdcomputers_html
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+
+# ---------------------------------------------------------------- legacy classifiers
+# Verbatim copies of the functions that used to live in app.py and the scrapers
+
+def legacy_app(title: str) -> str:
+    if not title:
+        return "Other"
+
+    lower_title = title.lower()
+
+    category_mapping = {
+        "CPU": ['i3', 'i5', 'i7', 'i9', 'ryzen', 'core', 'pentium', 'celeron', 'xeon'],
+        "GPU": ['rtx', 'gtx', 'radeon', 'arc', 'gpu', 'graphics card'],
+        "RAM": ['ddr3', 'ddr4', 'ddr5', 'ram', 'memory'],
+        "Motherboard": ['motherboard', 'mainboard', 'h61', 'b450', 'x570', 'z690'],
+        "Storage": ['ssd', 'nvme', 'hdd', 'hard disk', 'm.2'],
+        "PSU": ['psu', 'power supply', 'smps'],
+        "Case": ['case', 'chassis', 'cabinet'],
+        "Cooling": ['cooler', 'aio', 'fan', 'heatsink'],
+        "Monitor": ['monitor', 'display', 'screen'],
+        "Accessories": ['keyboard', 'mouse', 'headset']
+    }
+
+    for category, terms in category_mapping.items():
+        if any(term in lower_title for term in terms):
+            return category
+
+    return "Other"
+
+
+def legacy_amazon(title):
+    title = title.lower()
+    if any(x in title for x in ["i5", "i7", "i9", "ryzen", "core"]): return "CPU"
+    if any(x in title for x in ["rtx", "gtx", "radeon", "gpu"]): return "GPU"
+    if "ram" in title or "ddr" in title: return "RAM"
+    if "case" in title or "cabinet" in title: return "Case"
+    if "cooler" in title or "fan" in title or "aio" in title: return "Cooling"
+    if "monitor" in title or "display" in title: return "Monitor"
+    if "keyboard" in title or "mouse" in title or "accessory" in title: return "Accessories"
+    if "ssd" in title or "hdd" in title or "nvme" in title: return "Storage"
+    if "motherboard" in title or any(x in title for x in ["b660", "z790", "h610"]): return "Motherboard"
+    if "psu" in title or "power supply" in title: return "PSU"
+    return "Other"
+
+
+# flipkart.py carried an identical copy of the Amazon function
+legacy_flipkart = legacy_amazon
+
+
+def legacy_mdcomputers(title: str) -> str:
+    title = title.lower()
+    if any(x in title for x in ["i3", "i5", "i7", "i9", "ryzen", "core"]): return "CPU"
+    if any(x in title for x in ["gtx", "rtx", "radeon"]): return "GPU"
+    if "ram" in title or "ddr" in title: return "RAM"
+    if "motherboard" in title or any(x in title for x in ["b660", "z790", "h610"]): return "Motherboard"
+    if any(x in title for x in ["ssd", "nvme", "hdd"]): return "Storage"
+    if "psu" in title or "power supply" in title: return "PSU"
+    if "case" in title or "cabinet" in title: return "Case"
+    if "fan" in title or "cooling" in title or "aio" in title: return "Cooling"
+    if "monitor" in title: return "Monitor"
+    return "Other"
+
+
+CLASSIFIERS = {
+    "legacy app.py": legacy_app,
+    "legacy amazon/flipkart": legacy_amazon,
+    "legacy mdcomputers": legacy_mdcomputers,
+    "classify": classify,
+}
+
+# Typical listing titles and the category a quotation builder expects
+LABELLED_TITLES = [
+    ("AMD Ryzen 5 7600 Desktop Processor 6 Cores 12 Threads with Wraith Stealth Cooler", "CPU"),
+    ("Intel Core i5-12400F 12th Gen Desktop Processor", "CPU"),
+    ("Intel Core i9-14900K Processor", "CPU"),
+    ("ZOTAC Gaming GeForce RTX 4060 8GB GDDR6 Twin Edge OC Dual Fan Graphics Card", "GPU"),
+    ("MSI GeForce RTX 4070 Ventus 2X 12GB GDDR6X DisplayPort HDMI", "GPU"),
+    ("Sapphire Pulse AMD Radeon RX 7600 8GB GDDR6 Display Port", "GPU"),
+    ("Intel Arc A750 Limited Edition 8GB Graphics Card", "GPU"),
+    ("Corsair Vengeance 16GB DDR5 5200MHz Desktop Memory", "RAM"),
+    ("G.Skill Ripjaws V 8GB DDR4 3200MHz RAM", "RAM"),
+    ("MSI PRO B650M-A WiFi AM5 Motherboard for Ryzen 7000 Series", "Motherboard"),
+    ("ASUS ROG Strix Z790-E Gaming WiFi Motherboard DDR5", "Motherboard"),
+    ("Gigabyte B760M DS3H DDR4 Micro ATX Motherboard for Intel Core 13th Gen", "Motherboard"),
+    ("Samsung 990 PRO 1TB PCIe 4.0 M.2 NVMe SSD", "Storage"),
+    ("Seagate Barracuda 2TB Internal Hard Drive HDD", "Storage"),
+    ("WD Blue SN580 500GB NVMe SSD Programmable", "Storage"),
+    ("Cooler Master MWE 650 Bronze V2 Power Supply", "PSU"),
+    ("Corsair RM850e 850W 80+ Gold Fully Modular PSU", "PSU"),
+    ("Ant Esports ICE-511MT ARGB Mid Tower Gaming Cabinet", "Case"),
+    ("Lian Li O11 Dynamic EVO Chassis", "Case"),
+    ("Deepcool AK400 CPU Air Cooler", "Cooling"),
+    ("NZXT Kraken 240 RGB AIO Liquid Cooler", "Cooling"),
+    ("Arctic P12 PWM PST 120mm Case Fan 5 Pack", "Cooling"),
+    ("LG UltraGear 27 inch IPS 180Hz Gaming Monitor", "Monitor"),
+    ("Logitech G102 Lightsync Gaming Mouse", "Accessories"),
+    ("Redragon K552 Kumara Mechanical Gaming Keyboard", "Accessories"),
+    ("HyperX Cloud II Gaming Headset", "Accessories"),
+]
+
+
+def fixture_titles():
+    titles = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for fixture, parse_html in (
+            ("amazon_search.html", parse_amazon_html),
+            ("flipkart_search.html", parse_flipkart_html),
+            ("mdcomputers_search.html", parse_mdcomputers_html),
+        ):
+            html = (FIXTURES_DIR / fixture).read_text(encoding='utf-8')
+            titles.extend(p["title"] for p in parse_html(html, 50))
+    return titles
+
+
+def timed(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run_throughput(titles, repeat):
+    print(f"Throughput over {len(titles)} titles")
+    runs = {name: (lambda fn=fn: [fn(t) for t in titles]) for name, fn in CLASSIFIERS.items()}
+    runs["classify_many"] = lambda: classify_many(titles)
+    for name, run in runs.items():
+        timings = timed(run, repeat)
+        median = statistics.median(timings)
+        print(
+            f"  {name:<24} median {median * 1000:8.2f} ms  "
+            f"{len(titles) / median / 1000:8.1f}k titles/s"
+        )
+
+
+def run_accuracy(quiet=False):
+    print(f"Accuracy on {len(LABELLED_TITLES)} labelled titles")
+    for name, fn in CLASSIFIERS.items():
+        misses = [(title, expected, fn(title)) for title, expected in LABELLED_TITLES if fn(title) != expected]
+        print(f"  {name:<24} {len(LABELLED_TITLES) - len(misses):>3}/{len(LABELLED_TITLES)} correct")
+        for title, expected, got in ([] if quiet else misses):
+            print(f"      {got:<12} (expected {expected}) {title}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--titles", type=int, default=5000, help="size of the throughput corpus")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quiet", action="store_true", help="don't list misclassified titles")
+    args = parser.parse_args()
+
+    corpus = fixture_titles() + [title for title, _ in LABELLED_TITLES]
+    titles = (corpus * (args.titles // len(corpus) + 1))[:args.titles]
+
+    run_throughput(titles, args.repeat)
+    run_accuracy(args.quiet)
+
+
+if __name__ == "__main__":
+    main()
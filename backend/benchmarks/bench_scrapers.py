@@ -0,0 +1,112 @@
+"""Compare per-element WebDriver extraction with single-snapshot HTML parsing.
+
+Runs against the saved search pages in ``fixtures/``:
+
+    python -m backend.benchmarks.bench_scrapers            # snapshot parse timings only
+    python -m backend.benchmarks.bench_scrapers --browser  # also time both paths in headless Chrome
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import time
+from pathlib import Path
+
+from backend.scrapers.amazon import extract_amazon_elements, parse_amazon_html
+from backend.scrapers.flipkart import extract_flipkart_elements, parse_flipkart_html
+from backend.scrapers.mdcomputers import extract_mdcomputers_elements, parse_mdcomputers_html
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+# site -> (fixture file, snapshot parser, per-element extractor)
+BENCHMARKS = {
+    "amazon": ("amazon_search.html", parse_amazon_html, extract_amazon_elements),
+    "flipkart": ("flipkart_search.html", parse_flipkart_html, extract_flipkart_elements),
+    "mdcomputers": ("mdcomputers_search.html", parse_mdcomputers_html, extract_mdcomputers_elements),
+}
+
+
+def timed(fn, repeat):
+    """Run ``fn`` ``repeat`` times with scraper logging silenced; returns (result, timings)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - started)
+    return result, timings
+
+
+def report(label, results, timings, calls=None):
+    line = (
+        f"  {label:<22} {len(results):>3} results  "
+        f"median {statistics.median(timings) * 1000:8.2f} ms  "
+        f"min {min(timings) * 1000:8.2f} ms"
+    )
+    if calls is not None:
+        line += f"  {calls:>4} WebDriver calls"
+    print(line)
+
+
+def count_webdriver_calls(driver):
+    """Wrap ``driver.execute`` so every command sent to chromedriver is counted"""
+    counter = {"calls": 0}
+    execute = driver.execute
+
+    def counting_execute(*args, **kwargs):
+        counter["calls"] += 1
+        return execute(*args, **kwargs)
+
+    driver.execute = counting_execute
+    return counter
+
+
+def run_snapshot(repeat):
+    print("Snapshot parse (no browser)")
+    for site, (fixture, parse_html, _) in BENCHMARKS.items():
+        html = (FIXTURES_DIR / fixture).read_text(encoding='utf-8')
+        results, timings = timed(lambda: parse_html(html), repeat)
+        report(site, results, timings)
+
+
+def run_browser(repeat):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    driver = webdriver.Chrome(options=options)
+    counter = count_webdriver_calls(driver)
+
+    print("Headless Chrome (fixture loaded from disk)")
+    try:
+        for site, (fixture, parse_html, extract_elements) in BENCHMARKS.items():
+            driver.get((FIXTURES_DIR / fixture).resolve().as_uri())
+
+            counter["calls"] = 0
+            results, timings = timed(lambda: extract_elements(driver), repeat)
+            report(f"{site} elements", results, timings, counter["calls"] // repeat)
+
+            counter["calls"] = 0
+            results, timings = timed(lambda: parse_html(driver.page_source), repeat)
+            report(f"{site} page_source", results, timings, counter["calls"] // repeat)
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--browser", action="store_true", help="also benchmark inside headless Chrome")
+    args = parser.parse_args()
+
+    run_snapshot(args.repeat)
+    if args.browser:
+        run_browser(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Process-wide component catalog kept in memory and written through to its storage"""
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from backend.catalog.changes import ADDED, DELETED, UPDATED, ChangeLog
+from backend.catalog.index import ComponentIndex, index_terms, natural_key
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentCatalog:
+    """Components by id, loaded once and shared by every request.
+
+    ``storage`` is a ``JsonComponentStorage`` or ``SqliteComponentStorage``;
+    every mutation is persisted before it returns. The storage's signature
+    (file mtime, database data_version) is checked at most every
+    ``check_interval`` seconds, and the catalog reloads if another process
+    changed it. ``validate`` turns a stored entry into a component dict; entries
+    it rejects with ``ValueError``/``KeyError`` are logged and left out.
+
+    Every change, including ones picked up from storage, bumps ``revision`` and
+    is kept in a change log of ``max_changes`` entries for ``changes_since``.
+    """
+    def __init__(self, storage, validate: Optional[Callable[[Dict], Dict]] = None,
+                 check_interval: float = 1.0, max_changes: int = 10000):
+        self.storage = storage
+        self.validate = validate or dict
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._components: Dict[str, Dict] = {}
+        self._index = ComponentIndex()
+        self._changes = ChangeLog(max_changes)
+        self._signature = None
+        self._checked_at = 0.0
+        self._loads = 0
+        self._writes = 0
+        with self._lock:
+            self._load()
+
+    # ------------------------------------------------------------------ reads
+
+    def list(self, category: Optional[str] = None) -> List[Dict]:
+        """Components in storage order, optionally only one category (case-insensitive)"""
+        with self._lock:
+            self._check_storage()
+            if not category:
+                return list(self._components.values())
+            category = category.lower()
+            return [c for c in self._components.values() if c['category'].lower() == category]
+
+    def get(self, component_id: str) -> Optional[Dict]:
+        with self._lock:
+            self._check_storage()
+            return self._components.get(component_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._check_storage()
+            return len(self._components)
+
+    def search(self, text: Optional[str] = None, category: Optional[str] = None,
+               brand: Optional[str] = None, min_price: Optional[float] = None,
+               max_price: Optional[float] = None, sort: str = "catalog",
+               limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Dict], int, Optional[str]]:
+        """``(page, total, next_cursor)`` from the inverted index; see ``ComponentIndex.search``"""
+        with self._lock:
+            self._check_storage()
+            return self._index.search(text, category, brand, min_price, max_price, sort, limit, cursor)
+
+    @property
+    def revision(self) -> int:
+        with self._lock:
+            self._check_storage()
+            return self._changes.revision
+
+    def changes_since(self, revision: int) -> Dict:
+        """What changed after ``revision``: ids by kind plus the current added/updated components.
+
+        ``reset`` is true (and the lists empty) when the change log no longer
+        reaches back that far; the client should re-fetch the whole catalog.
+        """
+        with self._lock:
+            self._check_storage()
+            delta = self._changes.since(revision)
+            if delta is None:
+                return {"revision": self._changes.revision, "reset": True,
+                        ADDED: [], UPDATED: [], DELETED: [], "components": []}
+            return {
+                "revision": self._changes.revision,
+                "reset": False,
+                **delta,
+                "components": [self._components[i] for i in delta[ADDED] + delta[UPDATED]]
+            }
+
+    # -------------------------------------------------------------- mutations
+
+    def create(self, component: Dict) -> Dict:
+        """Store a component; raises ``TypeError``/``KeyError`` before writing one that can't be indexed"""
+        with self._lock:
+            self._check_storage()
+            change = UPDATED if component['id'] in self._components else ADDED
+            index_terms(component)
+            self._persist(self.storage.put, component)
+            self._components[component['id']] = component
+            self._index.add(component)
+            self._changes.record(component['id'], change)
+            return component
+
+    def update(self, component_id: str, component: Dict) -> Optional[Dict]:
+        """Replace a component; ``None`` if there is no component with that id"""
+        with self._lock:
+            self._check_storage()
+            if component_id not in self._components:
+                return None
+            component = {**component, 'id': component_id}
+            index_terms(component)
+            self._persist(self.storage.put, component)
+            self._components[component_id] = component
+            self._index.add(component)
+            self._changes.record(component_id, UPDATED)
+            return component
+
+    def delete(self, component_id: str) -> bool:
+        with self._lock:
+            self._check_storage()
+            if component_id not in self._components:
+                return False
+            self._persist(self.storage.delete, component_id)
+            del self._components[component_id]
+            self._index.remove(component_id)
+            self._changes.record(component_id, DELETED)
+            return True
+
+    def upsert_many(self, rows: Iterable[Dict], merge: Callable[[Optional[Dict], Dict], Optional[Dict]],
+                    match: str = "auto") -> List[Tuple[str, str]]:
+        """Create or update a batch of components, persisted in one storage write.
+
+        Each row is matched to an existing component by id (``match="id"``), by
+        brand and name (``"name"``) or by id and then brand and name (``"auto"``).
+        ``merge(existing, row)`` returns the component to store, or ``None`` to
+        leave the existing one alone; its result goes through ``validate``.
+        Returns one ``(outcome, id or error)`` per row, where the outcome is
+        "created", "updated", "skipped" or "error". Rows later in the batch see
+        the ones before them; one merged into a component that is new in this
+        batch still counts as "created".
+        """
+        with self._lock:
+            self._check_storage()
+            pending: Dict[str, Dict] = {}
+            pending_keys: Dict[Tuple[str, str], str] = {}
+            outcomes = []
+            for row in rows:
+                try:
+                    existing_id = self._match(row, match, pending, pending_keys)
+                    existing = pending.get(existing_id) or self._components.get(existing_id)
+                    merged = merge(existing, row)
+                    if merged is None:
+                        outcomes.append(("skipped", existing_id))
+                        continue
+                    component = self.validate({**merged, 'id': existing_id} if existing_id else merged)
+                    index_terms(component)
+                except (KeyError, ValueError, TypeError) as e:
+                    outcomes.append(("error", str(e)))
+                    continue
+                pending[component['id']] = component
+                pending_keys[natural_key(component)] = component['id']
+                # A row that matched another new row of this batch still created its component
+                outcome = "updated" if component['id'] in self._components else "created"
+                outcomes.append((outcome, component['id']))
+
+            if pending:
+                self._persist(self.storage.put_many, list(pending.values()))
+                for component_id, component in pending.items():
+                    change = UPDATED if component_id in self._components else ADDED
+                    self._components[component_id] = component
+                    self._index.add(component)
+                    self._changes.record(component_id, change)
+            return outcomes
+
+    def _match(self, row: Dict, match: str, pending: Dict, pending_keys: Dict) -> Optional[str]:
+        row_id = row.get('id')
+        if match in ("auto", "id") and row_id and (match == "id" or row_id in pending or row_id in self._components):
+            return row_id
+        if match in ("auto", "name"):
+            key = natural_key(row)
+            if all(key):
+                return pending_keys.get(key) or self._index.find_natural(key)
+        return None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "storage": self.storage.kind,
+                "revision": self._changes.revision,
+                "components": len(self._components),
+                "loads": self._loads,
+                "writes": self._writes
+            }
+
+    # --------------------------------------------------------------- storage
+
+    def _check_storage(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        if self.storage.signature() != self._signature:
+            logger.info("Component storage changed outside this process, reloading the catalog")
+            self._load()
+
+    def _load(self):
+        self._checked_at = time.monotonic()
+        signature = self.storage.signature()
+        try:
+            entries = self.storage.load()
+        except json.JSONDecodeError as e:
+            # Keep serving the last good copy until the file is fixed
+            logger.error(f"Invalid JSON in components file: {str(e)}")
+            self._signature = signature
+            return
+        components = {}
+        for entry in entries:
+            try:
+                component = self.validate(entry)
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Skipping invalid component {entry.get('id', '?')}: {str(e)}")
+                continue
+            components[component['id']] = component
+        if self._loads:
+            self._changes.record_diff(self._components, components)
+        self._components = components
+        self._index.rebuild(components.values())
+        self._signature = signature
+        self._loads += 1
+
+    def _persist(self, operation, *args):
+        # Storage first: if it fails, memory still matches what is on disk
+        operation(*args)
+        self._signature = self.storage.signature()
+        self._writes += 1
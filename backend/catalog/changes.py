@@ -0,0 +1,73 @@
+"""Catalog revisions and the change log behind delta sync"""
+import bisect
+import time
+from typing import Dict, List, Optional
+
+ADDED = "added"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+class ChangeLog:
+    """A monotonically increasing revision and the last ``max_entries`` changes.
+
+    Revisions start from the process start time in milliseconds, so they keep
+    increasing across restarts even though the log itself lives in memory. A
+    client whose revision is older than the oldest retained change (or from
+    before a restart) is told to reset and re-fetch the catalog.
+    """
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.revision = int(time.time() * 1000)
+        # Anything at or before this revision can no longer be replayed
+        self.base = self.revision
+        self._revisions: List[int] = []
+        self._entries: List[tuple] = []
+
+    def record(self, component_id: str, change: str) -> int:
+        self.revision += 1
+        self._revisions.append(self.revision)
+        self._entries.append((component_id, change))
+        if len(self._entries) > self.max_entries * 2:
+            # Trim in batches so appends stay O(1) amortized
+            drop = len(self._entries) - self.max_entries
+            self.base = self._revisions[drop - 1]
+            del self._revisions[:drop]
+            del self._entries[:drop]
+        return self.revision
+
+    def record_diff(self, old: Dict[str, Dict], new: Dict[str, Dict]):
+        """Record what turned ``old`` into ``new`` (both id -> component)"""
+        for component_id, component in new.items():
+            previous = old.get(component_id)
+            if previous is None:
+                self.record(component_id, ADDED)
+            elif previous != component:
+                self.record(component_id, UPDATED)
+        for component_id in old.keys() - new.keys():
+            self.record(component_id, DELETED)
+
+    def since(self, revision: int) -> Optional[Dict[str, List[str]]]:
+        """Ids added, updated and deleted after ``revision``, or ``None`` if it is too old to replay.
+
+        A component added and then deleted within the range is left out; one
+        deleted and then re-added counts as updated.
+        """
+        if revision < self.base or revision > self.revision:
+            return None
+        first, last = {}, {}
+        for index in range(bisect.bisect_right(self._revisions, revision), len(self._entries)):
+            component_id, change = self._entries[index]
+            first.setdefault(component_id, change)
+            last[component_id] = change
+
+        delta = {ADDED: [], UPDATED: [], DELETED: []}
+        for component_id, change in last.items():
+            if change == DELETED:
+                if first[component_id] != ADDED:
+                    delta[DELETED].append(component_id)
+            elif first[component_id] == ADDED:
+                delta[ADDED].append(component_id)
+            else:
+                delta[UPDATED].append(component_id)
+        return delta
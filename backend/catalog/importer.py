@@ -0,0 +1,180 @@
+"""Streaming bulk import of components from NDJSON, CSV or a JSON list.
+
+Rows are read one at a time from the request stream, normalized and handed to
+``ComponentCatalog.upsert_many`` in batches, so memory stays bounded by the
+batch size however long the supplier's price list is. Each batch is one
+storage transaction.
+"""
+import codecs
+import csv
+import json
+import math
+import re
+import time
+from datetime import datetime
+from typing import IO, Dict, Iterable, Iterator, Optional, Tuple
+
+FORMATS = ("ndjson", "csv", "json")
+MATCH_MODES = ("auto", "id", "name")
+
+# What happens when a row matches an existing component:
+#   update  - fields present in the row overwrite the stored ones, the rest are kept
+#   replace - the row replaces the stored component (id and created_at are kept)
+#   skip    - the stored component is left alone
+MERGE_POLICIES = ("update", "replace", "skip")
+
+FIELDS = ("id", "category", "name", "brand", "price", "warranty", "created_at")
+REQUIRED_FIELDS = ("category", "name", "brand", "price")
+TEXT_FIELDS = ("id", "category", "name", "brand", "warranty", "created_at")
+
+# Currency markers and thousands separators allowed around an imported price
+_PRICE_NOISE = re.compile(r"₹|\b(?:rs\.?|inr)|,|\s", re.IGNORECASE)
+
+
+def iter_ndjson(stream: IO[bytes]) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """``(line number, row, error)`` per non-blank line of a byte stream"""
+    for number, line in enumerate(codecs.getreader("utf-8")(stream), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, None, f"Invalid JSON: {str(e)}"
+            continue
+        if not isinstance(row, dict):
+            yield number, None, "Expected a JSON object"
+            continue
+        yield number, row, None
+
+
+def iter_csv(stream: IO[bytes]) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """``(line number, row, error)`` per data row of a CSV byte stream with a header row"""
+    reader = csv.DictReader(codecs.getreader("utf-8-sig")(stream))
+    for row in reader:
+        # Header names are matched case-insensitively; empty cells count as missing
+        cells = {
+            (key or "").strip().lower(): value.strip()
+            for key, value in row.items() if isinstance(value, str) and value.strip()
+        }
+        if cells:
+            yield reader.line_num, cells, None
+
+
+def iter_json(items: Iterable) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """``(position, row, error)`` for an already parsed list, e.g. ``{"components": [...]}``"""
+    for number, item in enumerate(items, start=1):
+        if isinstance(item, dict):
+            yield number, item, None
+        else:
+            yield number, None, "Expected a JSON object"
+
+
+def normalize_row(row: Dict) -> Dict:
+    """Known fields only, with text trimmed and prices such as "₹12,499" read as numbers"""
+    cleaned = {}
+    for field in FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == "":
+            continue
+        if field in TEXT_FIELDS and not isinstance(value, str):
+            raise ValueError(f"{field} must be text, got {value!r}")
+        cleaned[field] = value
+    if "price" in cleaned:
+        cleaned["price"] = parse_price(cleaned["price"])
+    return cleaned
+
+
+def parse_price(value) -> float:
+    """A positive price from a number or a string like "₹12,499" / "Rs. 12499.00"; ``ValueError`` otherwise"""
+    try:
+        if isinstance(value, bool):
+            raise ValueError
+        price = float(_PRICE_NOISE.sub("", value) if isinstance(value, str) else value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid price format: {value!r}")
+    if not math.isfinite(price) or price <= 0:
+        raise ValueError(f"Invalid price format: {value!r}")
+    return price
+
+
+def merger(policy: str):
+    """``merge(existing, row)`` for ``ComponentCatalog.upsert_many`` implementing a merge policy"""
+    if policy not in MERGE_POLICIES:
+        raise ValueError(f"merge must be one of {', '.join(MERGE_POLICIES)}")
+
+    def merge(existing: Optional[Dict], row: Dict) -> Optional[Dict]:
+        now = datetime.now().isoformat()
+        if existing is None:
+            component = {**row, 'updated_at': now}
+            component.setdefault('created_at', now)
+        elif policy == "skip":
+            return None
+        elif policy == "replace":
+            component = {**row, 'created_at': existing['created_at'], 'updated_at': now}
+        else:
+            component = {**existing, **row, 'created_at': existing['created_at'], 'updated_at': now}
+        missing = [field for field in REQUIRED_FIELDS if field not in component]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        return component
+
+    return merge
+
+
+def import_rows(catalog, rows: Iterable[Tuple[int, Optional[Dict], Optional[str]]],
+                merge: str = "update", match: str = "auto", batch_size: int = 500,
+                max_errors: int = 100) -> Dict:
+    """Upsert rows into ``catalog`` in batches and report what happened.
+
+    ``rows`` come from ``iter_ndjson``, ``iter_csv`` or ``iter_json``. The report
+    counts created, updated, skipped and failed rows, lists the first
+    ``max_errors`` failures with their row numbers, and gives the throughput.
+    """
+    if match not in MATCH_MODES:
+        raise ValueError(f"match must be one of {', '.join(MATCH_MODES)}")
+    merge_row = merger(merge)
+
+    started = time.perf_counter()
+    counts = {"rows": 0, "created": 0, "updated": 0, "skipped": 0, "failed": 0, "batches": 0}
+    errors = []
+
+    def fail(number, error):
+        counts["failed"] += 1
+        if len(errors) < max_errors:
+            errors.append({"row": number, "error": error})
+
+    def flush(batch):
+        outcomes = catalog.upsert_many([row for _, row in batch], merge_row, match)
+        counts["batches"] += 1
+        for (number, _), (outcome, detail) in zip(batch, outcomes):
+            if outcome == "error":
+                fail(number, detail)
+            else:
+                counts[outcome] += 1
+
+    batch = []
+    for number, row, error in rows:
+        counts["rows"] += 1
+        if error is None:
+            try:
+                batch.append((number, normalize_row(row)))
+            except ValueError as e:
+                error = str(e)
+        if error is not None:
+            fail(number, error)
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+    elapsed = time.perf_counter() - started
+    return {
+        **counts,
+        "errors": sorted(errors, key=lambda error: error["row"]),
+        "errors_truncated": counts["failed"] > len(errors),
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(counts["rows"] / elapsed, 1) if elapsed > 0 else None
+    }
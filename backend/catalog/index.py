@@ -0,0 +1,211 @@
+"""In-memory inverted index over the component catalog for search, filters and paging.
+
+Names, brands and categories are split into lowercase alphanumeric tokens
+("Core i5-12400F" -> core, i5, 12400f). A query matches a component when every
+query token is a prefix of one of its tokens, so "ryz 76" finds "Ryzen 5 7600".
+Prefixes are resolved against a sorted vocabulary with bisect, and the postings
+of the matching tokens are intersected, so a search only looks at the
+components that match instead of scanning the whole catalog.
+"""
+import base64
+import bisect
+import json
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# sort key -> (component field, descending); "catalog" keeps storage order
+SORTS = {
+    "catalog": (None, False),
+    "name_asc": ("name", False),
+    "name_desc": ("name", True),
+    "brand_asc": ("brand", False),
+    "brand_desc": ("brand", True),
+    "price_asc": ("price", False),
+    "price_desc": ("price", True),
+    "newest": ("updated_at", True),
+    "oldest": ("updated_at", False),
+}
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall((text or "").lower())
+
+
+def natural_key(component: Dict) -> Tuple[str, str]:
+    """(brand, name), case- and whitespace-insensitive: how imports recognise a component without an id"""
+    return (" ".join(str(component.get('brand') or "").lower().split()),
+            " ".join(str(component.get('name') or "").lower().split()))
+
+
+class ComponentIndex:
+    """Token, category and brand postings (sets of ids) plus each component's catalog position.
+
+    Not thread-safe on its own; ``ComponentCatalog`` updates and queries it under its lock.
+    """
+    def __init__(self):
+        self._docs: Dict[str, Dict] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        self._tokens: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._categories: Dict[str, Set[str]] = {}
+        self._brands: Dict[str, Set[str]] = {}
+        self._natural: Dict[Tuple[str, str], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def rebuild(self, components):
+        self.__init__()
+        for component in components:
+            self.add(component)
+
+    def add(self, component: Dict):
+        """Index a component, replacing an older version with the same id (which keeps its position)"""
+        component_id = component['id']
+        tokens, category, brand = index_terms(component)
+        if component_id in self._docs:
+            self._unindex(self._docs[component_id])
+        else:
+            self._positions[component_id] = self._next_position
+            self._next_position += 1
+        self._docs[component_id] = component
+
+        for token in tokens:
+            postings = self._tokens.get(token)
+            if postings is None:
+                postings = self._tokens[token] = set()
+                bisect.insort(self._vocabulary, token)
+            postings.add(component_id)
+        self._categories.setdefault(category, set()).add(component_id)
+        self._brands.setdefault(brand, set()).add(component_id)
+        self._natural[natural_key(component)] = component_id
+
+    def find_natural(self, key: Tuple[str, str]) -> Optional[str]:
+        """Id of the component with this ``natural_key``, if any"""
+        return self._natural.get(key)
+
+    def remove(self, component_id: str):
+        component = self._docs.pop(component_id, None)
+        if component is not None:
+            self._unindex(component)
+            del self._positions[component_id]
+
+    def search(self, text: Optional[str] = None, category: Optional[str] = None,
+               brand: Optional[str] = None, min_price: Optional[float] = None,
+               max_price: Optional[float] = None, sort: str = "catalog",
+               limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Dict], int, Optional[str]]:
+        """``(page, total matches, next cursor)``.
+
+        ``cursor`` is the opaque ``next_cursor`` of the previous page; pages are
+        keyset-based, so edits between requests don't shift later pages.
+        Raises ``ValueError`` for an unknown sort or a malformed cursor.
+        """
+        if sort not in SORTS:
+            raise ValueError(f"sort must be one of {', '.join(SORTS)}")
+        field, descending = SORTS[sort]
+
+        candidates = None
+        for postings in self._filter_postings(text, category, brand):
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                return [], 0, None
+        ids = self._docs.keys() if candidates is None else candidates
+        matches = [
+            self._docs[component_id] for component_id in ids
+            if (min_price is None or self._docs[component_id]['price'] >= min_price)
+            and (max_price is None or self._docs[component_id]['price'] <= max_price)
+        ]
+        total = len(matches)
+
+        def sort_key(component):
+            value = self._positions[component['id']] if field is None else component[field]
+            return (value.lower() if isinstance(value, str) else value, component['id'])
+
+        matches.sort(key=sort_key, reverse=descending)
+        if cursor:
+            after = decode_cursor(cursor, sort)
+            keys = [sort_key(component) for component in matches]
+            try:
+                if descending:
+                    start = len(keys) - bisect.bisect_left(keys[::-1], after)
+                else:
+                    start = bisect.bisect_right(keys, after)
+            except TypeError:
+                raise ValueError("Invalid cursor")
+            matches = matches[start:]
+
+        if limit is None or len(matches) <= limit:
+            return matches, total, None
+        page = matches[:limit]
+        return page, total, encode_cursor(sort, sort_key(page[-1]))
+
+    def _filter_postings(self, text, category, brand):
+        if category:
+            yield self._categories.get(category.lower(), set())
+        if brand:
+            yield self._brands.get(brand.lower(), set())
+        for token in set(tokenize(text)):
+            yield self._prefix_postings(token)
+
+    def _prefix_postings(self, prefix: str) -> Set[str]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = start
+        while end < len(self._vocabulary) and self._vocabulary[end].startswith(prefix):
+            end += 1
+        if end - start == 1:
+            return self._tokens[self._vocabulary[start]]
+        postings = set()
+        for token in self._vocabulary[start:end]:
+            postings |= self._tokens[token]
+        return postings
+
+    def _unindex(self, component: Dict):
+        component_id = component['id']
+        tokens, _, _ = index_terms(component)
+        for token in tokens:
+            postings = self._tokens[token]
+            postings.discard(component_id)
+            if not postings:
+                del self._tokens[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+        for postings_by_key, key in ((self._categories, component['category'].lower()),
+                                     (self._brands, component['brand'].lower())):
+            postings = postings_by_key[key]
+            postings.discard(component_id)
+            if not postings:
+                del postings_by_key[key]
+        key = natural_key(component)
+        if self._natural.get(key) == component_id:
+            del self._natural[key]
+
+
+def index_terms(component: Dict) -> Tuple[Set[str], str, str]:
+    """(tokens, category key, brand key) a component is indexed under.
+
+    Raises ``KeyError``/``TypeError`` for a component that can't be indexed, so
+    callers can check before persisting it.
+    """
+    fields = [component[field] for field in ('name', 'brand', 'category')]
+    if not all(isinstance(value, str) for value in fields):
+        raise TypeError("name, brand and category must be text")
+    return set(tokenize(" ".join(fields))), component['category'].lower(), component['brand'].lower()
+
+
+def encode_cursor(sort: str, key: Tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort, *key]).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple:
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        cursor_sort, value, component_id = decoded
+        if not isinstance(component_id, str):
+            raise TypeError
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if cursor_sort != sort:
+        raise ValueError("cursor was issued for a different sort")
+    return value, component_id
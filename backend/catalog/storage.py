@@ -0,0 +1,192 @@
+"""Where the component catalog is persisted: the legacy JSON file or an SQLite database.
+
+``ComponentCatalog`` keeps every component in memory and only needs a backend
+to load them once, persist each change and say whether another process has
+changed the data since (``signature``).
+"""
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("id", "category", "name", "brand", "price", "warranty", "created_at", "updated_at")
+
+
+class JsonComponentStorage:
+    """The catalog as one JSON array, rewritten atomically on every change"""
+    kind = "json"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._components: Dict[str, Dict] = {}
+
+    def load(self) -> List[Dict]:
+        if not self.path.exists():
+            self._components = {}
+            return []
+        with open(self.path, 'r') as f:
+            entries = json.load(f)
+        self._components = {entry.get('id'): entry for entry in entries}
+        return entries
+
+    def put(self, component: Dict):
+        self._components[component['id']] = component
+        self._write()
+
+    def put_many(self, components: Iterable[Dict]):
+        for component in components:
+            self._components[component['id']] = component
+        self._write()
+
+    def delete(self, component_id: str):
+        self._components.pop(component_id, None)
+        self._write()
+
+    def signature(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def close(self):
+        pass
+
+    def _write(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(list(self._components.values()), f, indent=2)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS components (
+    id TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    brand TEXT NOT NULL,
+    price REAL NOT NULL,
+    warranty TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS components_category ON components (category COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS components_brand ON components (brand COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Earlier versions kept an FTS5 index over names; search runs on the in-memory index
+_DROP_FTS = """
+DROP TRIGGER IF EXISTS components_fts_insert;
+DROP TRIGGER IF EXISTS components_fts_delete;
+DROP TRIGGER IF EXISTS components_fts_update;
+DROP TABLE IF EXISTS components_fts;
+"""
+
+# Upsert in place so a component keeps its rowid (and therefore its position)
+_UPSERT = f"""
+INSERT INTO components ({", ".join(FIELDS)}) VALUES ({", ".join("?" * len(FIELDS))})
+ON CONFLICT (id) DO UPDATE SET
+    {", ".join(f"{field} = excluded.{field}" for field in FIELDS[1:])}
+"""
+
+
+class SqliteComponentStorage:
+    """The catalog as rows in SQLite: an edit writes one row instead of the whole catalog.
+
+    ``id`` is the primary key and category and brand are indexed
+    (case-insensitive). Components load in insertion order.
+    """
+    kind = "sqlite"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.executescript(_DROP_FTS)
+
+    def load(self) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(FIELDS)} FROM components ORDER BY rowid").fetchall()
+        return [dict(row) for row in rows]
+
+    def put(self, component: Dict):
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, _row(component))
+
+    def put_many(self, components: Iterable[Dict]):
+        """Upsert a batch of components in one transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, (_row(c) for c in components))
+
+    def delete(self, component_id: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM components WHERE id = ?", (component_id,))
+
+    def import_json(self, path: Union[str, Path], validate: Callable[[Dict], Dict] = dict) -> Optional[int]:
+        """Copy a legacy components.json into the database, once.
+
+        Returns the number of components imported, or ``None`` if an import has
+        already been done or there is no file. Entries ``validate`` rejects are skipped.
+        """
+        path = Path(path)
+        with self._lock:
+            done = self._conn.execute("SELECT value FROM catalog_meta WHERE key = 'imported_json'").fetchone()
+        if done is not None or not path.exists():
+            return None
+
+        with open(path, 'r') as f:
+            entries = json.load(f)
+        # Later entries win when the file repeats an id, as they do when it is loaded
+        components = {}
+        for entry in entries:
+            try:
+                component = validate(entry)
+                components[component['id']] = component
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Not importing invalid component {entry.get('id', '?')}: {str(e)}")
+
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, (_row(c) for c in components.values()))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('imported_json', ?)",
+                (str(path),)
+            )
+        logger.info(f"Imported {len(components)} components from {path}")
+        return len(components)
+
+    def signature(self):
+        # data_version changes when another connection commits, not for our own writes
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _row(component: Dict) -> tuple:
+    return tuple(component.get(field, '') if field == 'warranty' else component[field] for field in FIELDS)
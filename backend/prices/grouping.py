@@ -0,0 +1,155 @@
+"""Group listings of the same product across sellers by their model numbers.
+
+A listing's identity is its category, model tokens (words that mix letters and
+digits or are long numbers: "7900x", "b650m", "sn580", "4060ti") and, when the
+title names one, its brand from ``KNOWN_BRANDS``. Listings join a group when
+they share a model token with it, none of their specs (capacity, wattage,
+speed, size) conflict and their brands don't differ; a listing that doesn't
+name its brand ("Ryzen 9 7900X Processor") can join a branded group. Groups are
+found through an index of model token -> groups, so each listing is compared
+only with the few groups that share one of its tokens.
+"""
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from backend.scrapers.prices import price_value
+
+# Brands told apart when grouping; any other word in a title may be a product line
+KNOWN_BRANDS = {
+    "amd", "intel", "nvidia", "asus", "msi", "gigabyte", "asrock", "zotac", "galax", "sapphire",
+    "powercolor", "xfx", "inno3d", "pny", "palit", "colorful", "biostar",
+    "corsair", "gskill", "kingston", "crucial", "adata", "xpg", "teamgroup", "hyperx", "patriot",
+    "samsung", "wd", "westerndigital", "seagate", "sandisk", "lexar", "hp", "dell", "lenovo", "acer", "lg", "benq", "viewsonic",
+    "antec", "coolermaster", "deepcool", "lianli", "nzxt", "thermaltake", "seasonic", "evga", "fractal",
+    "noctua", "arctic", "bequiet", "logitech", "razer", "redgear", "zebronics", "ant", "cosmic",
+}
+
+# "RTX 4060 Ti", "RX 7900 XTX", "990 Pro": suffixes that belong to the model number
+MODEL_SUFFIXES = {"ti", "super", "xt", "xtx", "ks", "kf", "k", "f", "x3d", "pro", "evo", "plus"}
+
+# Alphanumeric words that describe a platform or interface rather than a model
+NOT_MODELS = {
+    "am4", "am5", "lga1151", "lga1200", "lga1700", "lga1851",
+    "ddr3", "ddr4", "ddr5", "gddr5", "gddr6", "gddr6x", "gddr7",
+    "pcie3", "pcie4", "pcie5", "gen3", "gen4", "gen5", "wifi6", "wifi6e", "wifi7",
+    "usb2", "usb3", "hdmi2", "x4", "x8", "x16",
+}
+_NOT_MODEL_PATTERN = re.compile(r"\d+(?:st|nd|rd|th)|\d{1,2}x")
+
+_SPEC_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(gb|tb|w|mhz|hz|mm|inch|p)(?![a-z0-9])")
+_SPEC_KINDS = {"gb": "capacity", "tb": "capacity", "w": "power", "mhz": "speed", "hz": "refresh",
+               "mm": "size", "inch": "size", "p": "resolution"}
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def parse_title(title: str) -> Tuple[str, FrozenSet[str], Dict[str, FrozenSet[str]]]:
+    """(brand from ``KNOWN_BRANDS`` or "", model tokens, specs by kind) for a listing title"""
+    text = (title or "").lower()
+
+    specs = {}
+    for value, unit in _SPEC_PATTERN.findall(text):
+        number = float(value) * (1024 if unit == "tb" else 1)
+        specs.setdefault(_SPEC_KINDS[unit], set()).add(f"{number:g}")
+    text = _SPEC_PATTERN.sub(" ", text)
+
+    words = _WORD.findall(text)
+    models = set()
+    for index, word in enumerate(words):
+        if word in NOT_MODELS or _NOT_MODEL_PATTERN.fullmatch(word):
+            continue
+        has_digit = any(char.isdigit() for char in word)
+        if not has_digit or len(word) < 3:
+            continue
+        if index + 1 < len(words) and words[index + 1] in MODEL_SUFFIXES:
+            word += words[index + 1]
+        models.add(word)
+
+    # Two-word brands ("Cooler Master", "G.Skill", "Western Digital") are listed joined up
+    brand = next((name for name in (
+        candidate for index, word in enumerate(words)
+        for candidate in (word, "".join(words[index:index + 2]))
+    ) if name in KNOWN_BRANDS), "")
+    return brand, frozenset(models), {kind: frozenset(values) for kind, values in specs.items()}
+
+
+def _specs_compatible(a: Dict[str, FrozenSet[str]], b: Dict[str, FrozenSet[str]]) -> bool:
+    return all(a[kind] & b[kind] for kind in a.keys() & b.keys())
+
+
+class _Group:
+    __slots__ = ("brand", "category", "models", "specs", "listings")
+
+    def __init__(self, brand, category, models, specs):
+        self.brand = brand
+        self.category = category
+        self.models = models
+        self.specs = specs
+        self.listings = []
+
+    def accepts(self, brand, category, models, specs) -> bool:
+        if category != self.category or not _specs_compatible(specs, self.specs):
+            return False
+        if brand and self.brand and brand != self.brand:
+            return False
+        shared = len(models & self.models)
+        # Same model numbers, or one listing names a superset of the other's
+        return shared == min(len(models), len(self.models)) or shared * 2 >= len(models | self.models)
+
+
+def group_products(products: List[Dict]) -> List[Dict]:
+    """Group normalized search results that list the same product.
+
+    Returns one entry per group, in order of first appearance, with the cheapest
+    priced listing as ``best_offer`` and the rest (cheapest first) in ``offers``.
+    Listings without a model token stay in a group of their own.
+    """
+    groups: List[_Group] = []
+    index: Dict[str, List[_Group]] = {}
+
+    for product in products:
+        brand, models, specs = parse_title(product.get("title", ""))
+        category = product.get("category", "")
+
+        group: Optional[_Group] = None
+        if models:
+            candidates = {id(g): g for model in models for g in index.get(model, ())}
+            matches = [g for g in candidates.values() if g.accepts(brand, category, models, specs)]
+            if matches:
+                group = max(matches, key=lambda g: len(models & g.models))
+
+        if group is None:
+            group = _Group(brand, category, models, specs)
+            groups.append(group)
+        else:
+            group.brand = group.brand or brand
+            group.models = group.models | models
+            for kind, values in specs.items():
+                group.specs[kind] = group.specs.get(kind, frozenset()) | values
+
+        group.listings.append(product)
+        for model in models:
+            bucket = index.setdefault(model, [])
+            if group not in bucket:
+                bucket.append(group)
+
+    return [_summarize(group) for group in groups]
+
+
+def _summarize(group: _Group) -> Dict:
+    priced = sorted(
+        ((price_value(listing.get("price")), position, listing) for position, listing in enumerate(group.listings)),
+        key=lambda item: (item[0] is None, item[0] or 0, item[1])
+    )
+    prices = [price for price, _, _ in priced if price is not None]
+    best = priced[0][2]
+    return {
+        "key": " ".join([group.brand] + sorted(group.models)).strip(),
+        "title": best.get("title", ""),
+        "category": group.category,
+        "count": len(group.listings),
+        "sites": sorted({listing.get("site", "") for listing in group.listings}),
+        "lowest_price": prices[0] if prices else None,
+        "highest_price": prices[-1] if prices else None,
+        "best_offer": best,
+        "offers": [listing for _, _, listing in priced[1:]]
+    }
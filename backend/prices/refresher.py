@@ -0,0 +1,127 @@
+"""Background re-scraping of watched queries into the price store"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from .store import PriceStore
+
+logger = logging.getLogger(__name__)
+
+
+class PriceRefresher:
+    """Keeps watched queries fresh in the price store.
+
+    Every ``check_every`` seconds the refresher asks ``watched()`` for the
+    queries to keep fresh (``[{"query", "sellers"}]``) and re-scrapes those whose
+    least recently scraped seller is older than ``interval``, stalest first, at
+    most ``concurrency`` at a time and at most ``max_per_pass`` per pass, so a
+    long watchlist is spread over several checks instead of occupying the
+    browsers in one burst. ``scrape(query, sellers)`` is expected to
+    record its results in the store itself. ``maintenance()``, if given, runs
+    after every pass (e.g. to downsample price history).
+    """
+    def __init__(
+        self,
+        store: PriceStore,
+        scrape: Callable[[str, List[str]], None],
+        watched: Callable[[], List[Dict]],
+        interval: float = 6 * 3600,
+        check_every: float = 300,
+        concurrency: int = 2,
+        max_per_pass: Optional[int] = 5,
+        maintenance: Optional[Callable[[], None]] = None
+    ):
+        self.store = store
+        self.scrape = scrape
+        self.watched = watched
+        self.interval = interval
+        self.check_every = check_every
+        self.concurrency = concurrency
+        self.max_per_pass = max_per_pass
+        self.maintenance = maintenance
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats = {"runs": 0, "refreshed": 0, "failed": 0, "last_run": None, "last_duration": 0.0}
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="price-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self):
+        """Run a refresh pass now instead of waiting for the next check"""
+        self._wake.set()
+
+    def due(self, now: float = None) -> List[Dict]:
+        """Watched queries past their refresh interval, stalest first"""
+        now = time.time() if now is None else now
+        entries = []
+        for entry in self.watched():
+            oldest = self.store.oldest_scrape(entry["query"], entry["sellers"])
+            if now - oldest >= self.interval:
+                entries.append((oldest, entry))
+        entries.sort(key=lambda item: item[0])
+        return [entry for _, entry in entries]
+
+    def refresh_due(self) -> int:
+        """Re-scrape the stalest due queries (up to ``max_per_pass``); returns how many were refreshed"""
+        started = time.monotonic()
+        entries = self.due()[:self.max_per_pass]
+        refreshed = failed = 0
+
+        if entries:
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="price-refresh") as executor:
+                futures = {
+                    executor.submit(self.scrape, entry["query"], entry["sellers"]): entry
+                    for entry in entries
+                }
+                wait(futures)
+                for future, entry in futures.items():
+                    try:
+                        future.result()
+                        refreshed += 1
+                    except Exception as e:
+                        failed += 1
+                        logger.error(f"Price refresh for {entry['query']!r} failed: {str(e)}")
+
+        with self._lock:
+            self._stats["runs"] += 1
+            self._stats["refreshed"] += refreshed
+            self._stats["failed"] += failed
+            self._stats["last_run"] = time.time()
+            self._stats["last_duration"] = round(time.monotonic() - started, 3)
+        return refreshed
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["running"] = self._thread is not None and not self._stop.is_set()
+        stats["interval"] = self.interval
+        stats["concurrency"] = self.concurrency
+        stats["max_per_pass"] = self.max_per_pass
+        return stats
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh_due()
+            except Exception as e:
+                logger.error(f"Price refresher error: {str(e)}")
+            if self.maintenance is not None:
+                try:
+                    self.maintenance()
+                except Exception as e:
+                    logger.error(f"Price store maintenance error: {str(e)}")
+            self._wake.wait(self.check_every)
+            self._wake.clear()
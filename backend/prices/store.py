@@ -0,0 +1,430 @@
+"""SQLite store of every scraped product and the searches that found them"""
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, parse_qsl, unquote, urlencode, urlsplit
+
+from backend.scrapers.prices import price_value
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    site TEXT NOT NULL,
+    key TEXT NOT NULL,
+    link TEXT NOT NULL,
+    title TEXT NOT NULL,
+    category TEXT,
+    price REAL,
+    data TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    UNIQUE (site, key)
+);
+
+CREATE TABLE IF NOT EXISTS search_results (
+    query TEXT NOT NULL,
+    site TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    product_id INTEGER NOT NULL REFERENCES products (id),
+    PRIMARY KEY (query, site, rank)
+);
+
+CREATE TABLE IF NOT EXISTS searches (
+    query TEXT NOT NULL,
+    site TEXT NOT NULL,
+    scraped_at REAL NOT NULL,
+    count INTEGER NOT NULL,
+    error TEXT,
+    -- How many results the scrape asked for; NULL when unknown
+    max_results INTEGER,
+    PRIMARY KEY (query, site)
+);
+
+-- Price observations: one row per scrape while recent (resolution 0), merged
+-- into one row per day (resolution 86400) once older than the raw retention
+CREATE TABLE IF NOT EXISTS price_history (
+    product_id INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    resolution INTEGER NOT NULL,
+    low REAL NOT NULL,
+    high REAL NOT NULL,
+    total REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    PRIMARY KEY (product_id, resolution, ts)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS watchlist (
+    query TEXT PRIMARY KEY,
+    sellers TEXT NOT NULL,
+    added_at REAL NOT NULL
+);
+"""
+
+DAY = 86400
+
+_MERGE_POINT = """
+ON CONFLICT (product_id, resolution, ts) DO UPDATE SET
+    low = MIN(low, excluded.low), high = MAX(high, excluded.high),
+    total = total + excluded.total, samples = samples + excluded.samples
+"""
+
+# Amazon product ids, also found URL-encoded inside sponsored-result redirects
+_ASIN = re.compile(r"/(?:dp|gp/product)/([A-Z0-9]{10})(?=[/?&#]|$)", re.IGNORECASE)
+# Amazon's "/ref=sr_1_3" style tracking segment at the end of the path
+_REF_SEGMENT = re.compile(r"/ref=[^/]*$")
+# Query parameters that vary per search or click rather than per product
+_TRACKING_PARAMS = {
+    "qid", "ref", "ref_", "crid", "sr", "sprefix", "keywords", "dib", "dib_tag", "th", "psc",
+    "iid", "lid", "marketplace", "srno", "otracker", "otracker1", "fm", "ppt", "ppn", "ssid", "qh", "store",
+    "aclk", "form", "search", "description", "cvid", "sp", "sc", "sk", "ghc",
+}
+
+
+def product_key(product: Dict) -> str:
+    """Identity of a product within its site, stable across scrapes.
+
+    Result links carry per-search tracking (``qid``/``ref``, ``iid``, ``aclk``),
+    so the key is the Amazon ASIN or Flipkart ``pid`` when the link has one,
+    otherwise the link without its ``/ref=`` segment and tracking parameters
+    (Bing and OpenCart product pages are identified by their query string).
+    Products without a link are keyed by title.
+    """
+    link = product.get("link") or ""
+    if link in ("", "#"):
+        return "title:" + (product.get("title") or "").strip().lower()
+
+    asin = _ASIN.search(unquote(link))
+    if asin:
+        return "asin:" + asin.group(1).upper()
+    parts = urlsplit(link)
+    pid = parse_qs(parts.query).get("pid")
+    if pid:
+        return "pid:" + pid[0].upper()
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query)
+        if name.lower() not in _TRACKING_PARAMS and not name.lower().startswith("utm_")
+    ))
+    key = f"{parts.scheme}://{parts.netloc.lower()}{_REF_SEGMENT.sub('', parts.path)}"
+    return f"{key}?{query}" if query else key
+
+
+class PriceStore:
+    """Records search results per (query, site) so they can be served without scraping.
+
+    ``query`` is expected to be normalized by the caller. Products are keyed by
+    site and ``product_key``; each search keeps its own ranked list of product
+    ids, so a product found by several queries is stored once with its latest price.
+
+    History is compacted (see ``compact``) when the store opens and after every
+    ``compact_every`` recorded searches, so it stays bounded whether or not a
+    background refresher is running.
+    """
+    def __init__(self, path: Union[str, Path], raw_retention: float = 2 * DAY,
+                 history_retention: float = 365 * DAY, compact_every: int = 200):
+        self.path = Path(path)
+        self.raw_retention = raw_retention
+        self.history_retention = history_retention
+        self.compact_every = compact_every
+        self._recorded = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(searches)")}
+            if "max_results" not in columns:
+                self._conn.execute("ALTER TABLE searches ADD COLUMN max_results INTEGER")
+            self._rekey_products()
+        self.compact()
+
+    def record_search(self, query: str, site: str, results: List[Dict],
+                      error: Optional[str] = None, scraped_at: Optional[float] = None,
+                      max_results: Optional[int] = None):
+        """Store one seller's results for a query, replacing its previous ranking.
+
+        ``max_results`` is the limit the scrape ran with, so ``lookup`` can tell
+        a short list from a truncated one. A failed scrape only updates the
+        search's error; the last good results stay in place but are no longer
+        counted as fresh.
+        """
+        now = time.time() if scraped_at is None else scraped_at
+        with self._lock, self._conn:
+            if error or not results:
+                self._conn.execute(
+                    "UPDATE searches SET error = ? WHERE query = ? AND site = ?",
+                    (error or "No results", query, site)
+                )
+                return
+
+            self._conn.execute("DELETE FROM search_results WHERE query = ? AND site = ?", (query, site))
+            for rank, product in enumerate(results):
+                product_id = self._upsert_product(site, product, now)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO search_results (query, site, rank, product_id) VALUES (?, ?, ?, ?)",
+                    (query, site, rank, product_id)
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches (query, site, scraped_at, count, error, max_results) "
+                "VALUES (?, ?, ?, ?, NULL, ?)",
+                (query, site, now, len(results), max_results)
+            )
+            self._recorded += 1
+            due = self.compact_every and self._recorded % self.compact_every == 0
+        if due:
+            self.compact()
+
+    def lookup(self, query: str, site: str, max_age: float, limit: int) -> Optional[Tuple[List[Dict], float]]:
+        """``(results, age)`` for the last good scrape of a query if it is fresh enough.
+
+        A scrape that ran with a smaller limit than ``limit`` and filled it is a
+        miss: the seller may have more results than were stored.
+        """
+        with self._lock:
+            search = self._conn.execute(
+                "SELECT scraped_at, count, max_results FROM searches WHERE query = ? AND site = ? AND error IS NULL",
+                (query, site)
+            ).fetchone()
+            age = time.time() - search["scraped_at"] if search else None
+            if age is None or age > max_age:
+                return None
+            scraped_limit = search["max_results"]
+            if scraped_limit is None or (scraped_limit < limit and search["count"] >= scraped_limit):
+                return None
+            rows = self._conn.execute(
+                """
+                SELECT p.data FROM search_results r JOIN products p ON p.id = r.product_id
+                WHERE r.query = ? AND r.site = ? ORDER BY r.rank LIMIT ?
+                """,
+                (query, site, limit)
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows], age
+
+    def product(self, product_id: int) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, site, title, link, category, price, first_seen, last_seen FROM products WHERE id = ?",
+                (product_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def find_products(self, text: str, limit: int = 50) -> List[Dict]:
+        """Stored products whose title contains ``text``, most recently seen first"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT id, site, title, link, category, price, first_seen, last_seen FROM products
+                WHERE title LIKE ? ESCAPE '\\' ORDER BY last_seen DESC LIMIT ?
+                """,
+                ("%" + re.sub(r"([%_\\])", r"\\\1", text) + "%", limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def query_product_ids(self, query: str) -> List[int]:
+        """Products currently listed for a (normalized) query across all sites"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT product_id FROM search_results WHERE query = ?", (query,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def daily_prices(self, product_ids: List[int], since: float) -> List[Dict]:
+        """Per-day low, high, average and sample count across ``product_ids`` since a timestamp"""
+        if not product_ids:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT CAST(ts / {DAY} AS INTEGER) AS day, MIN(low), MAX(high), SUM(total), SUM(samples)
+                FROM price_history
+                WHERE product_id IN ({','.join('?' * len(product_ids))}) AND ts >= ?
+                GROUP BY day ORDER BY day
+                """,
+                (*product_ids, since)
+            ).fetchall()
+        return [
+            {
+                "date": time.strftime("%Y-%m-%d", time.gmtime(day * DAY)),
+                "low": low,
+                "high": high,
+                "average": round(total / samples, 2),
+                "samples": samples
+            }
+            for day, low, high, total, samples in rows
+        ]
+
+    def compact(self, raw_retention: Optional[float] = None, history_retention: Optional[float] = None,
+                now: Optional[float] = None) -> dict:
+        """Merge raw observations older than ``raw_retention`` into daily rows and drop
+        anything older than ``history_retention``, so history grows by at most one
+        row per product per day. Products not seen within ``history_retention``
+        are removed along with their search listings. Retentions default to
+        the store's."""
+        now = time.time() if now is None else now
+        raw_retention = self.raw_retention if raw_retention is None else raw_retention
+        history_retention = self.history_retention if history_retention is None else history_retention
+        cutoff = now - raw_retention
+        with self._lock, self._conn:
+            merged = self._conn.execute(
+                f"""
+                INSERT INTO price_history (product_id, ts, resolution, low, high, total, samples)
+                SELECT product_id, CAST(ts / {DAY} AS INTEGER) * {DAY}, {DAY},
+                       MIN(low), MAX(high), SUM(total), SUM(samples)
+                FROM price_history WHERE resolution = 0 AND ts < ?
+                GROUP BY product_id, CAST(ts / {DAY} AS INTEGER)
+                {_MERGE_POINT}
+                """,
+                (cutoff,)
+            ).rowcount
+            removed = self._conn.execute(
+                "DELETE FROM price_history WHERE resolution = 0 AND ts < ?", (cutoff,)
+            ).rowcount
+            expired = self._conn.execute(
+                "DELETE FROM price_history WHERE ts < ?", (now - history_retention,)
+            ).rowcount
+            stale = "SELECT id FROM products WHERE last_seen < ?"
+            self._conn.execute(f"DELETE FROM search_results WHERE product_id IN ({stale})",
+                               (now - history_retention,))
+            self._conn.execute(f"DELETE FROM price_history WHERE product_id IN ({stale})",
+                               (now - history_retention,))
+            pruned = self._conn.execute(
+                "DELETE FROM products WHERE last_seen < ?", (now - history_retention,)
+            ).rowcount
+        return {"daily_rows": merged, "raw_removed": removed, "expired": expired, "products_removed": pruned}
+
+    def oldest_scrape(self, query: str, sites: List[str]) -> float:
+        """When the least recently scraped of ``sites`` was last scraped successfully (0 if never)"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT site, scraped_at FROM searches WHERE query = ? AND error IS NULL "
+                f"AND site IN ({','.join('?' * len(sites))})",
+                (query, *sites)
+            ).fetchall()
+        scraped = {row["site"]: row["scraped_at"] for row in rows}
+        return min(scraped.get(site, 0.0) for site in sites) if sites else 0.0
+
+    # ---------------------------------------------------------------- watchlist
+
+    def watch(self, query: str, sellers: List[str]):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watchlist (query, sellers, added_at) VALUES (?, ?, ?)",
+                (query, ",".join(sellers), time.time())
+            )
+
+    def unwatch(self, query: str) -> bool:
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM watchlist WHERE query = ?", (query,)).rowcount > 0
+
+    def watched(self) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute("SELECT query, sellers, added_at FROM watchlist ORDER BY added_at").fetchall()
+        return [
+            {"query": row["query"], "sellers": row["sellers"].split(","), "added_at": row["added_at"]}
+            for row in rows
+        ]
+
+    def stats(self) -> dict:
+        with self._lock:
+            products = self._conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+            searches = self._conn.execute("SELECT COUNT(*), MIN(scraped_at) FROM searches").fetchone()
+            watched = self._conn.execute("SELECT COUNT(*) FROM watchlist").fetchone()[0]
+            history = self._conn.execute(
+                "SELECT COUNT(*), SUM(resolution = 0) FROM price_history"
+            ).fetchone()
+        return {
+            "products": products,
+            "history_points": history[0],
+            "raw_history_points": history[1] or 0,
+            "searches": searches[0],
+            "oldest_search_age": round(time.time() - searches[1], 1) if searches[1] else None,
+            "watched": watched,
+            "size_bytes": self.path.stat().st_size if self.path.exists() else 0
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _rekey_products(self):
+        """Move rows stored under an older ``product_key`` onto the current one.
+
+        A listing saved before keys were canonical can have one row per tracking
+        variant of its link; those rows are merged into one product that keeps
+        every history point and search listing and the most recently seen data.
+        """
+        rows = self._conn.execute("SELECT id, site, key, link, title, last_seen FROM products").fetchall()
+        merged = set()
+        for row in rows:
+            key = product_key({"link": row["link"], "title": row["title"]})
+            if key == row["key"] or row["id"] in merged:
+                continue
+            other = self._conn.execute(
+                "SELECT id, last_seen FROM products WHERE site = ? AND key = ?", (row["site"], key)
+            ).fetchone()
+            if other is not None:
+                keep, drop = (row, other) if row["last_seen"] > other["last_seen"] else (other, row)
+                self._merge_product(drop["id"], keep["id"])
+                merged.add(drop["id"])
+            if other is None or keep is row:
+                self._conn.execute("UPDATE products SET key = ? WHERE id = ?", (key, row["id"]))
+
+    def _merge_product(self, source: int, target: int):
+        """Fold product ``source`` into ``target``: history, search listings and first sighting"""
+        self._conn.execute(
+            f"""
+            INSERT INTO price_history (product_id, ts, resolution, low, high, total, samples)
+            SELECT ?, ts, resolution, low, high, total, samples FROM price_history WHERE product_id = ?
+            {_MERGE_POINT}
+            """,
+            (target, source)
+        )
+        self._conn.execute("DELETE FROM price_history WHERE product_id = ?", (source,))
+        self._conn.execute("UPDATE search_results SET product_id = ? WHERE product_id = ?", (target, source))
+        self._conn.execute(
+            "UPDATE products SET first_seen = MIN(first_seen, (SELECT first_seen FROM products WHERE id = ?)) "
+            "WHERE id = ?",
+            (source, target)
+        )
+        self._conn.execute("DELETE FROM products WHERE id = ?", (source,))
+
+    def _upsert_product(self, site: str, product: Dict, now: float) -> int:
+        key = product_key(product)
+        price = price_value(product.get("price"))
+        self._conn.execute(
+            """
+            INSERT INTO products (site, key, link, title, category, price, data, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (site, key) DO UPDATE SET
+                link = excluded.link, title = excluded.title, category = excluded.category, price = excluded.price,
+                data = excluded.data, last_seen = excluded.last_seen
+            """,
+            (
+                site,
+                key,
+                product.get("link", ""),
+                product.get("title", ""),
+                product.get("category", ""),
+                price,
+                json.dumps(product),
+                now,
+                now
+            )
+        )
+        product_id = self._conn.execute(
+            "SELECT id FROM products WHERE site = ? AND key = ?", (site, key)
+        ).fetchone()[0]
+
+        if price is not None:
+            self._conn.execute(
+                "INSERT INTO price_history (product_id, ts, resolution, low, high, total, samples) "
+                "VALUES (?, ?, 0, ?, ?, ?, 1)" + _MERGE_POINT,
+                (product_id, now, price, price, price)
+            )
+        return product_id
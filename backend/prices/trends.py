@@ -0,0 +1,59 @@
+"""Summaries of a daily price series: range, average and moving average"""
+from typing import Dict, List, Optional
+
+
+def moving_average(values: List[float], window: int) -> List[float]:
+    """Trailing mean of the last ``window`` values at each position"""
+    averages = []
+    running = 0.0
+    for index, value in enumerate(values):
+        running += value
+        if index >= window:
+            running -= values[index - window]
+        averages.append(running / min(index + 1, window))
+    return averages
+
+
+def price_trend(points: List[Dict], window: int = 7, value: str = "average") -> Dict:
+    """Min, max, average and a ``window``-day moving average over daily points.
+
+    ``points`` come from ``PriceStore.daily_prices``; ``value`` picks which daily
+    figure the moving average follows ("average" for one product, "low" for the
+    best offer across several).
+    """
+    if not points:
+        return {
+            "current": None,
+            "min": None,
+            "max": None,
+            "average": None,
+            "moving_average": None,
+            "vs_moving_average": None,
+            "points": []
+        }
+
+    values = [point[value] for point in points]
+    averages = moving_average(values, max(1, window))
+    samples = sum(point["samples"] for point in points)
+    current = values[-1]
+    latest_average = averages[-1]
+
+    return {
+        "current": current,
+        "min": min(point["low"] for point in points),
+        "max": max(point["high"] for point in points),
+        "average": round(sum(point["average"] * point["samples"] for point in points) / samples, 2),
+        "moving_average": round(latest_average, 2),
+        # Negative means the latest price is below its recent average
+        "vs_moving_average": _percent_change(current, latest_average),
+        "points": [
+            {**point, "moving_average": round(average, 2)}
+            for point, average in zip(points, averages)
+        ]
+    }
+
+
+def _percent_change(current: float, reference: float) -> Optional[float]:
+    if not reference:
+        return None
+    return round((current - reference) / reference * 100, 2)
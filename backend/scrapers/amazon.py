@@ -1,61 +1,87 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium import webdriver
+from selectolax.lexbor import LexborHTMLParser
 
-def detect_category(title):
-    title = title.lower()
-    if any(x in title for x in ["i5", "i7", "i9", "ryzen", "core"]): return "CPU"
-    if any(x in title for x in ["rtx", "gtx", "radeon", "gpu"]): return "GPU"
-    if "ram" in title or "ddr" in title: return "RAM"
-    if "case" in title or "cabinet" in title: return "Case"
-    if "cooler" in title or "fan" in title or "aio" in title: return "Cooling"
-    if "monitor" in title or "display" in title: return "Monitor"
-    if "keyboard" in title or "mouse" in title or "accessory" in title: return "Accessories"
-    if "ssd" in title or "hdd" in title or "nvme" in title: return "Storage"
-    if "motherboard" in title or any(x in title for x in ["b660", "z790", "h610"]): return "Motherboard"
-    if "psu" in title or "power supply" in title: return "PSU"
-    return "Other"
+from .categories import classify
+from .prices import price_fields
+from .tiers import fetch_html
+from .tabs import TabJob
+from .waits import wait_for_results
 
 def init_driver():
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--no-sandbox")
+    chrome_options.page_load_strategy = "eager"
     return webdriver.Chrome(options=chrome_options)
 
-def scrape_amazon(driver, query):
-    print("Scraping Amazon.in...")
-    products = []
+RESULT_SELECTOR = "div.s-main-slot > div[data-component-type='s-search-result']"
 
+def search_url(query):
     formatted_query = query.replace(" ", "+")
-    url = f"https://www.amazon.in/s?k={formatted_query}"
-    driver.get(url)
+    return f"https://www.amazon.in/s?k={formatted_query}"
+
+def absolute_link(href):
+    if not href:
+        return "#"
+    return "https://www.amazon.in" + href if href.startswith("/") else href
+
+def shorten(title):
+    return title[:80] + "..." if len(title) > 80 else title
+
+def make_product(title, price, link):
+    category = classify(title)
+    print(f"[Amazon] {title} - {price} - {link} - {category}")
+    return {
+        "site": "Amazon",
+        "title": title,
+        **price_fields(price),
+        "link": link,
+        "category": category
+    }
+
+def parse_amazon_html(html, limit=10):
+    """Extract search results from a page_source snapshot in a single parse"""
+    parser = LexborHTMLParser(html)
+    items = parser.css(RESULT_SELECTOR)
+    print(f"[INFO] Found {len(items)} items.")
 
-    try:
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.s-main-slot > div[data-component-type='s-search-result']"))
-        )
-    except:
-        print("[ERROR] Amazon results did not load.")
-        return []
+    products = []
+    for item in items[:limit]:
+        title_node = item.css_first("h2 span")
+        title = title_node.text().strip() if title_node else ""
+        if not title:
+            print("[WARN] Skipping item without title.")
+            continue
+
+        a_tag = item.css_first("h2 a")
+        link = absolute_link(a_tag.attributes.get("href") if a_tag else None)
+
+        price_node = item.css_first("span.a-price span.a-price-whole")
+        price = price_node.text().strip() if price_node else "N/A"
+
+        products.append(make_product(shorten(title), price, link))
+
+    return products
 
-    items = driver.find_elements(By.CSS_SELECTOR, "div.s-main-slot > div[data-component-type='s-search-result']")
+def extract_amazon_elements(driver, limit=10):
+    """Extract search results with one WebDriver round trip per field"""
+    items = driver.find_elements(By.CSS_SELECTOR, RESULT_SELECTOR)
     print(f"[INFO] Found {len(items)} items.")
 
-    for item in items[:10]:
+    products = []
+    for item in items[:limit]:
         try:
-            title = item.find_element(By.CSS_SELECTOR, "h2 span").text.strip()
-            title = title[:80] + "..." if len(title) > 80 else title
+            title = shorten(item.find_element(By.CSS_SELECTOR, "h2 span").text.strip())
         except:
             print("[WARN] Skipping item without title.")
             continue
 
         try:
             a_tag = item.find_element(By.CSS_SELECTOR, "h2 a")
-            partial_link = a_tag.get_attribute("href")
-            link = "https://www.amazon.in" + partial_link if partial_link.startswith("/") else partial_link
+            link = absolute_link(a_tag.get_attribute("href"))
         except:
             link = "#"
 
@@ -64,19 +90,40 @@ def scrape_amazon(driver, query):
         except:
             price = "N/A"
 
-        category = detect_category(title)
-
-        print(f"[Amazon] {title} - {price} - {link} - {category}")
-        products.append({
-            "site": "Amazon",
-            "title": title,
-            "price": price,
-            "link": link,
-            "category": category
-        })
+        products.append(make_product(title, price, link))
 
     return products
 
+def scrape_amazon_http(query, limit=10):
+    """Scrape Amazon.in search results from the static page, without a browser"""
+    print("Scraping Amazon.in (static)...")
+    html = fetch_html(search_url(query))
+    return parse_amazon_html(html, limit) if html else []
+
+def amazon_tab_job(query, limit=10):
+    """Describe an Amazon search for the multi-tab scraper"""
+    return TabJob(search_url(query), RESULT_SELECTOR, lambda html: parse_amazon_html(html, limit))
+
+def scrape_amazon(driver, query, mode="page_source", timeout=15):
+    """Scrape Amazon.in search results.
+
+    ``mode="page_source"`` (the default) grabs the rendered HTML once and parses it
+    locally; ``mode="elements"`` walks the results through WebDriver calls.
+    ``timeout`` bounds the wait for the result grid.
+    """
+    print("Scraping Amazon.in...")
+    driver.get(search_url(query))
+
+    try:
+        wait_for_results(driver, RESULT_SELECTOR, timeout)
+    except:
+        print("[ERROR] Amazon results did not load.")
+        return []
+
+    if mode == "elements":
+        return extract_amazon_elements(driver)
+    return parse_amazon_html(driver.page_source)
+
 # -------------- Add This Part Below -----------------
 
 from .flipkart import scrape_flipkart
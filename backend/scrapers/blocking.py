@@ -0,0 +1,141 @@
+"""Keep scraper browsers from downloading images, fonts, stylesheets and trackers"""
+import json
+import logging
+import threading
+from typing import Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+BLOCKED_RESOURCES = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"],
+    "media": ["*.mp4", "*.webm", "*.m3u8"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "stylesheets": ["*.css"],
+    "trackers": [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*facebook.net*",
+        "*connect.facebook.com*",
+        "*amazon-adsystem.com*",
+        "*fls-eu.amazon.*",
+        "*unagi.amazon.*",
+        "*scorecardresearch.com*",
+        "*hotjar.com*",
+        "*clarity.ms*",
+        "*criteo.*",
+        "*taboola.com*",
+    ],
+}
+
+# What each site must still be allowed to load: whole resource groups and/or single patterns
+SITE_ALLOW_LISTS = {
+    "amazon": {"groups": [], "patterns": []},
+    "flipkart": {"groups": [], "patterns": []},
+    "mdcomputers": {"groups": [], "patterns": []},
+}
+
+# Chrome content settings: 2 = block. Images are not blocked here: they go through
+# the per-site URL patterns so a site's allow-list can let them through
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+
+
+def configure_options(options):
+    """Apply the blocking profile to ChromeOptions before the driver is created"""
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    # Network events are read back from the performance log to count blocked requests
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def blocked_patterns(site: str) -> List[str]:
+    allow = SITE_ALLOW_LISTS.get(site, {})
+    allowed_groups = set(allow.get("groups", []))
+    allowed_patterns = set(allow.get("patterns", []))
+    return [
+        pattern
+        for group, patterns in BLOCKED_RESOURCES.items() if group not in allowed_groups
+        for pattern in patterns if pattern not in allowed_patterns
+    ]
+
+
+def apply_block_profile(driver, site: str):
+    """Install the site's URL blocklist on a driver right before it navigates"""
+    try:
+        driver.get_log("performance")  # drop events left over from the previous checkout
+    except Exception:
+        pass
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_patterns(site)})
+
+
+def network_events(log_entries: Iterable[dict]):
+    for entry in log_entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if message.get("method", "").startswith("Network."):
+            yield message["method"], message.get("params", {})
+
+
+class BlockStats:
+    """Per-site counters of requests blocked and bytes actually transferred.
+
+    Blocked requests never reach the network, so their size is unknown; the
+    saving shows up as lower ``bytes_transferred`` per page.
+    """
+    def __init__(self):
+        self._sites = {}
+        self._lock = threading.Lock()
+
+    def collect(self, driver, site: str):
+        """Read the driver's network events for the page it just scraped"""
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"No performance log for {site}: {str(e)}")
+            return
+
+        resource_types = {}
+        counts = {"pages": 1, "requests_blocked": 0, "requests_completed": 0, "bytes_transferred": 0}
+        blocked_by_type: Dict[str, int] = {}
+
+        for method, params in network_events(entries):
+            if method == "Network.requestWillBeSent":
+                resource_types[params.get("requestId")] = params.get("type", "Other")
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                counts["requests_blocked"] += 1
+                resource_type = params.get("type") or resource_types.get(params.get("requestId"), "Other")
+                blocked_by_type[resource_type] = blocked_by_type.get(resource_type, 0) + 1
+            elif method == "Network.loadingFinished":
+                counts["requests_completed"] += 1
+                counts["bytes_transferred"] += int(params.get("encodedDataLength") or 0)
+
+        with self._lock:
+            totals = self._sites.setdefault(site, {
+                "pages": 0,
+                "requests_blocked": 0,
+                "requests_completed": 0,
+                "bytes_transferred": 0,
+                "blocked_by_type": {}
+            })
+            for key, value in counts.items():
+                totals[key] += value
+            for resource_type, value in blocked_by_type.items():
+                totals["blocked_by_type"][resource_type] = totals["blocked_by_type"].get(resource_type, 0) + value
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                site: {
+                    **totals,
+                    "blocked_by_type": dict(totals["blocked_by_type"]),
+                    "bytes_per_page": totals["bytes_transferred"] // totals["pages"] if totals["pages"] else 0
+                }
+                for site, totals in self._sites.items()
+            }
@@ -0,0 +1,158 @@
+"""Per-seller circuit breakers with timeouts adapted from observed latency"""
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops calling a seller that keeps failing, then probes it again after a cooldown.
+
+    The breaker trips once at least ``min_calls`` of the last ``window`` scrapes
+    are recorded and the failure rate reaches ``failure_threshold``. While open,
+    the seller is skipped; after ``cooldown`` seconds one probe is let through
+    (half-open) and its outcome decides whether the breaker closes or re-opens.
+
+    Latencies are kept per fetch tier ("http", "browser"), so a few slow
+    browser fallbacks don't inflate the static-fetch deadline and fast static
+    hits don't starve the browser fallback of time.
+    """
+    def __init__(
+        self,
+        max_timeout: float,
+        min_timeout: float = 5.0,
+        timeout_factor: float = 1.5,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_threshold: float = 0.6,
+        cooldown: float = 120.0
+    ):
+        self.max_timeout = max_timeout
+        self.min_timeout = min_timeout
+        self.timeout_factor = timeout_factor
+        self.min_calls = min_calls
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.window = window
+        self._outcomes = deque(maxlen=window)
+        self._latencies: Dict[str, deque] = {}
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_started = None
+        self._trips = 0
+        self._skipped = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether the seller should be scraped now"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == OPEN and now - self._opened_at >= self.cooldown:
+                self._state = HALF_OPEN
+                self._probe_started = None
+            # A probe whose outcome never came back (e.g. an abandoned stream) is retried
+            if self._state == HALF_OPEN and (
+                self._probe_started is None or now - self._probe_started >= self.cooldown
+            ):
+                self._probe_started = now
+                return True
+            self._skipped += 1
+            return False
+
+    def record(self, success: bool, latency: Optional[float] = None, tier: str = "http"):
+        """Record a scrape's outcome; ``latency`` is sampled for the tier that produced the results"""
+        with self._lock:
+            self._outcomes.append(success)
+            if success and latency is not None:
+                self._latencies.setdefault(tier, deque(maxlen=self.window)).append(latency)
+
+            if self._state == HALF_OPEN:
+                self._probe_started = None
+                if success:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._trip()
+                return
+
+            if self._state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self.failure_threshold:
+                    self._trip()
+
+    def timeout(self, tier: str = "http") -> float:
+        """Budget for one tier: p95 of its recent successful latencies with headroom"""
+        with self._lock:
+            latencies = sorted(self._latencies.get(tier, ()))
+        if len(latencies) < self.min_calls:
+            return self.max_timeout
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return max(self.min_timeout, min(self.max_timeout, p95 * self.timeout_factor))
+
+    def deadline(self, tiers: Iterable[str] = ("http",)) -> float:
+        """Deadline for a whole scrape that may run each of ``tiers`` in turn"""
+        return min(self.max_timeout, sum(self.timeout(tier) for tier in tiers))
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            tiers = list(self._latencies) or ["http"]
+        timeouts = {tier: round(self.timeout(tier), 2) for tier in tiers}
+        retry_in = self.retry_in()
+        with self._lock:
+            outcomes = list(self._outcomes)
+            return {
+                "state": self._state,
+                "failure_rate": round(outcomes.count(False) / len(outcomes), 3) if outcomes else 0.0,
+                "calls": len(outcomes),
+                "timeouts": timeouts,
+                "trips": self._trips,
+                "skipped": self._skipped,
+                "retry_in": round(retry_in, 1)
+            }
+
+    def _trip(self):
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._trips += 1
+
+
+class BreakerRegistry:
+    """One breaker per seller, created on first use"""
+    def __init__(self, max_timeouts: Dict[str, float], default_max_timeout: float = 30.0, **breaker_options):
+        self.max_timeouts = max_timeouts
+        self.default_max_timeout = default_max_timeout
+        self.breaker_options = breaker_options
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, site: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(site)
+            if breaker is None:
+                breaker = self._breakers[site] = CircuitBreaker(
+                    self.max_timeouts.get(site, self.default_max_timeout),
+                    **self.breaker_options
+                )
+            return breaker
+
+    def timeouts(self, site_tiers: Dict[str, Iterable[str]]) -> Dict[str, float]:
+        """Whole-scrape deadline per site, given the fetch tiers each site may go through"""
+        return {site: self.get(site).deadline(tiers) for site, tiers in site_tiers.items()}
+
+    def stats(self, sites: Optional[list] = None) -> dict:
+        with self._lock:
+            names = list(self._breakers) if sites is None else sites
+        return {site: self.get(site).snapshot() for site in names}
@@ -0,0 +1,232 @@
+"""In-memory search result cache with TTL, LRU eviction and shared in-flight scrapes"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Tuple
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query"""
+    return " ".join(query.lower().split())
+
+
+class _CacheEntry:
+    __slots__ = ("value", "stored_at", "expires_at", "size")
+
+    def __init__(self, value, ttl: float, size: int):
+        self.value = value
+        self.stored_at = time.monotonic()
+        self.expires_at = self.stored_at + ttl
+        self.size = size
+
+
+class _Flight:
+    """A scrape in progress that other callers with the same key can wait on.
+
+    A streamed scrape also publishes its partial ``items`` as they arrive.
+    """
+    __slots__ = ("done", "value", "error", "items", "changed")
+
+    def __init__(self, streaming: bool = False):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.items = [] if streaming else None
+        self.changed = threading.Condition()
+
+    def publish(self, item):
+        with self.changed:
+            self.items.append(item)
+            self.changed.notify_all()
+
+    def finish(self):
+        with self.changed:
+            self.done.set()
+            self.changed.notify_all()
+
+
+class SearchCache:
+    """LRU cache bounded by both entry count and approximate payload bytes.
+
+    ``get_or_compute`` makes identical concurrent lookups share a single
+    computation: the first caller runs it, the rest wait for its result.
+    ``stream_or_compute`` does the same for computations that produce partial
+    results, and both share the same in-flight table.
+    """
+    def __init__(self, max_entries: int = 256, max_bytes: int = 8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "shared": 0, "evictions": 0}
+
+    def get(self, key: Hashable):
+        """Return ``(value, age_seconds)`` for a live entry, or ``None``"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = time.monotonic()
+            if entry.expires_at <= now:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.value, now - entry.stored_at
+
+    def put(self, key: Hashable, value, ttl: float):
+        if ttl <= 0:
+            return
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CacheEntry(value, ttl, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._counters["evictions"] += 1
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Tuple[Any, float]],
+        refresh: bool = False
+    ) -> Tuple[Any, bool, float]:
+        """Return ``(value, cached, age_seconds)``.
+
+        ``compute`` returns ``(value, ttl)``; a ttl of 0 means the value is
+        handed to every waiting caller but not stored.
+        """
+        if not refresh:
+            hit = self.get(key)
+            if hit is not None:
+                with self._lock:
+                    self._counters["hits"] += 1
+                return hit[0], True, hit[1]
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self._counters["misses"] += 1
+            else:
+                self._counters["shared"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, False, 0.0
+
+        try:
+            value, ttl = compute()
+            flight.value = value
+            self.put(key, value, ttl)
+            return value, False, 0.0
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.finish()
+
+    def stream_or_compute(
+        self,
+        key: Hashable,
+        produce: Callable[[], Iterable],
+        finish: Callable[[List], Tuple[Any, float]]
+    ) -> Iterator[Tuple[str, Any]]:
+        """Run or join the in-flight computation for ``key``, yielding its progress.
+
+        The first caller iterates ``produce()`` and yields ``("item", item)``
+        for each item; identical concurrent callers replay the same items as
+        they arrive. Once ``produce()`` is exhausted, ``finish(items)`` returns
+        ``(value, ttl)``, which is cached and handed to ``get_or_compute``
+        callers waiting on the key. A caller that joins a ``get_or_compute``
+        run (which has no items) gets a single ``("value", value)``. The cache
+        itself is not read; check ``get`` first.
+        """
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight(streaming=True)
+                self._counters["misses"] += 1
+            else:
+                self._counters["shared"] += 1
+
+        if leader:
+            yield from self._lead_stream(key, flight, produce, finish)
+        else:
+            yield from self._follow_stream(flight)
+
+    def _lead_stream(self, key, flight: _Flight, produce, finish):
+        listening = True
+        try:
+            for item in produce():
+                flight.publish(item)
+                if listening:
+                    try:
+                        yield "item", item
+                    except GeneratorExit:
+                        # Our client went away; finish the run for the callers sharing it
+                        listening = False
+            value, ttl = finish(flight.items)
+            flight.value = value
+            self.put(key, value, ttl)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.finish()
+
+    @staticmethod
+    def _follow_stream(flight: _Flight):
+        sent = 0
+        while True:
+            with flight.changed:
+                while not flight.done.is_set() and sent >= len(flight.items or ()):
+                    flight.changed.wait()
+                pending = (flight.items or [])[sent:]
+                done = flight.done.is_set()
+            for item in pending:
+                yield "item", item
+            sent += len(pending)
+            if done and sent >= len(flight.items or ()):
+                break
+        if flight.error is not None:
+            raise flight.error
+        if flight.items is None:
+            yield "value", flight.value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "inflight": len(self._inflight),
+                **self._counters
+            }
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
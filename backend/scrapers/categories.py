@@ -0,0 +1,174 @@
+"""Component category detection shared by the API and every scraper.
+
+All keywords are compiled into one regex (literal keywords factored into a
+prefix trie), so a title is scanned once no matter how many categories there
+are. Keywords only match whole words
+("ram" does not match "program", "fan" does not match "fantastic").
+
+When a title matches several categories, the one with the strongest keyword
+wins. Compound phrases that name one product after another ("CPU cooler",
+"case fan") are strongest. Product-type nouns ("motherboard", "graphics card")
+come next and beat family and model names ("ryzen", "rtx", "b650"), so "B650
+motherboard for Ryzen 7000" is a Motherboard. Weak nouns that often describe
+another product ("dual fan", "display port", "GDDR6 memory") rank with the
+family names. Ties go to the category listed first.
+"""
+import re
+from typing import Iterable, List
+
+OTHER = "Other"
+
+COMPOUND = 0
+PRODUCT_TYPE = 1
+FAMILY = 2
+
+# category -> (strength, keywords); keywords are literal words or phrases unless
+# wrapped in /.../, which marks a regular expression
+CATEGORY_KEYWORDS = {
+    "CPU": [
+        (PRODUCT_TYPE, ["processor", "cpu"]),
+        (FAMILY, ["ryzen", "core", "i3", "i5", "i7", "i9", "pentium", "celeron", "xeon", "athlon",
+                  "threadripper"]),
+    ],
+    "GPU": [
+        (PRODUCT_TYPE, ["graphics card", "video card", "gpu"]),
+        (FAMILY, ["rtx", "gtx", "geforce", "radeon", "arc", r"/rx[ \t]?\d{3,4}/"]),
+    ],
+    "RAM": [
+        (PRODUCT_TYPE, ["ram", "desktop memory"]),
+        (FAMILY, ["memory", r"/ddr[2-5]?/", "dimm", "so-dimm"]),
+    ],
+    "Motherboard": [
+        (PRODUCT_TYPE, ["motherboard", "mainboard"]),
+        # Chipsets such as H61, B450, X570, Z690, B660, Z790, H610
+        (FAMILY, [r"/[abhxz]\d{2,3}[a-z]?/"]),
+    ],
+    "Storage": [
+        (PRODUCT_TYPE, ["ssd", "nvme", "hdd", "hard disk", "hard drive", "m.2"]),
+    ],
+    "PSU": [
+        (PRODUCT_TYPE, ["psu", "power supply", "smps"]),
+    ],
+    "Case": [
+        (PRODUCT_TYPE, ["case", "chassis", "cabinet"]),
+    ],
+    "Cooling": [
+        (COMPOUND, ["cpu cooler", "cpu air cooler", "cpu fan", "case fan", "cabinet fan", "liquid cooler"]),
+        (PRODUCT_TYPE, ["cooler", "cooling", "aio", "heatsink"]),
+        (FAMILY, ["fan", "fans"]),
+    ],
+    "Monitor": [
+        (PRODUCT_TYPE, ["monitor"]),
+        (FAMILY, ["display", "screen"]),
+    ],
+    "Accessories": [
+        (PRODUCT_TYPE, ["keyboard", "mouse", "headset", "accessory"]),
+    ],
+}
+
+CATEGORIES = list(CATEGORY_KEYWORDS)
+
+
+def _is_regex(keyword: str) -> bool:
+    return keyword.startswith("/") and keyword.endswith("/")
+
+
+def _trie_pattern(keywords) -> str:
+    """One regex for many literal keywords, factored into a prefix trie.
+
+    Python's regex engine tries alternatives one by one at every position, so
+    ``cpu|cpu cooler|case|...`` costs a comparison per keyword; the trie form
+    ``c(?:pu(?:[ \\t]+cooler)?|ase)`` rejects most positions on the first letter.
+    Longer keywords are tried first, so "cpu cooler" wins over "cpu".
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in " ".join(keyword.split()):
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        branches = [
+            # Any run of spaces or tabs between words, but never a newline (see classify_many)
+            (r"[ \t]+" if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _compile():
+    literal_ranks = {}
+    regex_groups = []
+    regex_ranks = {}
+    for order, (category, tiers) in enumerate(CATEGORY_KEYWORDS.items()):
+        for strength, keywords in tiers:
+            rank = (strength, order, category)
+            for keyword in keywords:
+                if _is_regex(keyword):
+                    name = f"r{len(regex_groups)}"
+                    regex_ranks[name] = rank
+                    regex_groups.append(f"(?P<{name}>{keyword[1:-1]})")
+                else:
+                    literal_ranks.setdefault(" ".join(keyword.split()), rank)
+
+    alternation = "|".join([_trie_pattern(literal_ranks)] + regex_groups)
+    pattern = re.compile(r"(?<![a-z0-9])(?:" + alternation + r")(?![a-z0-9])")
+    return pattern, literal_ranks, regex_ranks
+
+
+_PATTERN, _LITERAL_RANKS, _REGEX_RANKS = _compile()
+_BEST_RANK = min(_LITERAL_RANKS.values())
+
+
+def _rank(match):
+    if match.lastgroup is not None:
+        return _REGEX_RANKS[match.lastgroup]
+    keyword = match.group()
+    rank = _LITERAL_RANKS.get(keyword)
+    return rank if rank is not None else _LITERAL_RANKS[" ".join(keyword.split())]
+
+
+def _best(matches) -> str:
+    best = None
+    for match in matches:
+        rank = _rank(match)
+        if best is None or rank < best:
+            best = rank
+            if rank == _BEST_RANK:
+                break
+    return best[2] if best else OTHER
+
+
+def classify(title: str) -> str:
+    """Component category of a product title ("Other" if nothing matches)"""
+    if not title:
+        return OTHER
+    return _best(_PATTERN.finditer(title.lower()))
+
+
+def classify_many(titles: Iterable[str]) -> List[str]:
+    """Categories for a whole result set, scanned as one newline-joined text"""
+    # Lowercase before measuring offsets: lower() can change a string's length
+    titles = [(title or "").lower().replace("\n", " ") for title in titles]
+    if not titles:
+        return []
+
+    # Matches arrive in order, so walk the title boundaries alongside them
+    best = [None] * len(titles)
+    index = 0
+    next_start = len(titles[0]) + 1
+    for match in _PATTERN.finditer("\n".join(titles)):
+        position = match.start()
+        while position >= next_start:
+            index += 1
+            next_start += len(titles[index]) + 1
+        rank = _rank(match)
+        if best[index] is None or rank < best[index]:
+            best[index] = rank
+    return [rank[2] if rank else OTHER for rank in best]
@@ -0,0 +1,67 @@
+"""Resolve the chromedriver binary once and remember where it lives"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_resolved = {}
+
+
+def _load_manifest(manifest_path: Path) -> dict:
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(manifest_path: Path, manifest: dict):
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        logger.error(f"Could not write chromedriver manifest: {str(e)}")
+
+
+def resolve_chromedriver(version: str, manifest_path: Path) -> str:
+    """Return the chromedriver path for a Chrome version.
+
+    Looked up at most once per process: first in memory, then in the on-disk
+    manifest, and only then through webdriver-manager (which may hit the network).
+    """
+    with _lock:
+        path = _resolved.get(version)
+        if path:
+            return path
+
+        manifest = _load_manifest(manifest_path)
+        entry = manifest.get(version) or {}
+        path = entry.get('path')
+
+        if not path or not os.path.isfile(path):
+            # Imported lazily so cached launches never load webdriver-manager
+            from webdriver_manager.chrome import ChromeDriverManager
+            from webdriver_manager.core.os_manager import ChromeType
+
+            logger.info(f"Resolving chromedriver {version} via webdriver-manager")
+            path = ChromeDriverManager(
+                chrome_type=ChromeType.GOOGLE,
+                driver_version=version
+            ).install()
+            manifest[version] = {
+                'path': path,
+                'resolved_at': datetime.now().isoformat()
+            }
+            _save_manifest(manifest_path, manifest)
+
+        _resolved[version] = path
+        return path
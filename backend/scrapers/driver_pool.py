@@ -0,0 +1,242 @@
+"""Bounded pool of reusable headless Chrome drivers"""
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """Raised when no driver becomes available within the checkout timeout"""
+
+
+class PooledDriver:
+    """A driver plus the bookkeeping the pool needs to decide when to recycle it"""
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+class DriverPool:
+    """Hands out warm drivers and takes them back, recycling worn-out ones.
+
+    At most ``size`` drivers exist at once. A driver is health-checked on checkout,
+    has its cookies and storage wiped on checkin, and is replaced after ``max_uses``
+    page loads or once the page's JS heap grows past ``max_heap_mb``.
+    """
+    def __init__(
+        self,
+        factory: Callable,
+        size: int = 3,
+        max_uses: int = 50,
+        max_heap_mb: int = 512,
+        checkout_timeout: float = 30.0
+    ):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.max_heap_mb = max_heap_mb
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = deque()
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._waits = deque(maxlen=200)
+        self._counters = {
+            "checkouts": 0,
+            "created": 0,
+            "recycled": 0,
+            "discarded": 0,
+            "timeouts": 0
+        }
+
+    # ---------------------------------------------------------------- checkout
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """Take a healthy driver from the pool, starting a new one if there is room"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            with self._cond:
+                while not self._idle and self._total >= self.size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._counters["timeouts"] += 1
+                        raise PoolTimeout(f"No driver available after {timeout:.1f}s")
+                    self._cond.wait(remaining)
+
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+
+                pooled = self._idle.popleft() if self._idle else None
+                if pooled is None:
+                    # Reserve the slot before starting Chrome outside the lock
+                    self._total += 1
+
+            if pooled is None:
+                try:
+                    pooled = self._create()
+                except Exception:
+                    self._release_slot()
+                    raise
+            elif not self._is_healthy(pooled):
+                self._discard(pooled, "failed health check")
+                continue
+
+            with self._cond:
+                self._counters["checkouts"] += 1
+                self._waits.append(time.monotonic() - started)
+            return pooled
+
+    def checkin(self, pooled: PooledDriver):
+        """Return a driver to the pool, recycling it if it has done enough work"""
+        pooled.uses += 1
+
+        if self._closed:
+            self._discard(pooled, "pool closed")
+            return
+        if pooled.uses >= self.max_uses:
+            self._recycle(pooled, f"served {pooled.uses} pages")
+            return
+
+        heap_mb = self._heap_mb(pooled)
+        if heap_mb is None:
+            self._discard(pooled, "unresponsive on checkin")
+            return
+        if heap_mb > self.max_heap_mb:
+            self._recycle(pooled, f"JS heap at {heap_mb:.0f}MB")
+            return
+
+        try:
+            self._reset(pooled.driver)
+        except Exception as e:
+            self._discard(pooled, f"reset failed: {str(e)}")
+            return
+
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Check a driver out for the duration of a ``with`` block"""
+        pooled = self.checkout(timeout)
+        try:
+            yield pooled.driver
+        finally:
+            self.checkin(pooled)
+
+    # ---------------------------------------------------------------- lifecycle
+
+    def prewarm(self, count: Optional[int] = None, background: bool = True):
+        """Start drivers ahead of the first search so it doesn't pay for browser startup"""
+        count = min(self.size, count or self.size)
+
+        def warm():
+            started = []
+            for _ in range(count):
+                try:
+                    started.append(self.checkout())
+                except Exception as e:
+                    logger.error(f"Driver pool prewarm failed: {str(e)}")
+                    break
+            for pooled in started:
+                pooled.uses -= 1  # warming isn't real work
+                self.checkin(pooled)
+            logger.info(f"Driver pool prewarmed with {len(started)} driver(s)")
+
+        if background:
+            threading.Thread(target=warm, name="driver-pool-prewarm", daemon=True).start()
+        else:
+            warm()
+
+    def close(self):
+        """Quit every idle driver; drivers still checked out are quit on checkin"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled, "pool closed")
+
+    def stats(self) -> dict:
+        with self._cond:
+            waits = sorted(self._waits)
+            idle = len(self._idle)
+            total = self._total
+            counters = dict(self._counters)
+
+        return {
+            "size": self.size,
+            "total": total,
+            "idle": idle,
+            "in_use": total - idle,
+            **counters,
+            "wait_avg": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "wait_p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3) if waits else 0.0,
+            "wait_max": round(waits[-1], 3) if waits else 0.0
+        }
+
+    # ---------------------------------------------------------------- internals
+
+    def _create(self) -> PooledDriver:
+        pooled = PooledDriver(self.factory())
+        with self._cond:
+            self._counters["created"] += 1
+        return pooled
+
+    def _release_slot(self):
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    def _discard(self, pooled: PooledDriver, reason: str, counter: str = "discarded"):
+        logger.info(f"Retiring pooled driver: {reason}")
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.error(f"Error quitting driver: {str(e)}")
+        with self._cond:
+            self._counters[counter] += 1
+        self._release_slot()
+
+    def _recycle(self, pooled: PooledDriver, reason: str):
+        self._discard(pooled, reason, counter="recycled")
+
+    @staticmethod
+    def _is_healthy(pooled: PooledDriver) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _heap_mb(pooled: PooledDriver) -> Optional[float]:
+        try:
+            used = pooled.driver.execute_script(
+                "return (window.performance && performance.memory) ? performance.memory.usedJSHeapSize : 0"
+            )
+            return (used or 0) / (1024 * 1024)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _reset(driver):
+        """Wipe cookies and storage so the next checkout starts from a clean profile"""
+        try:
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+        except Exception:
+            pass
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
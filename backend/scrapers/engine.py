@@ -0,0 +1,216 @@
+"""Asyncio scraping core with a synchronous entry point for Flask views.
+
+All searches share one event loop running on a background thread. Static pages
+are fetched with aiohttp on that loop, so any number of concurrent searches can
+wait on the network without a thread each; only Selenium work, which is
+inherently blocking, runs on a small bounded executor.
+"""
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+import aiohttp
+
+from .runner import SiteResult
+from .session import BROWSER_HEADERS, DEFAULT_CONFIG
+from .tiers import TierStats
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class SiteSpec:
+    """How to scrape one seller.
+
+    ``parse_html(html, limit)`` extracts results from a static page. When
+    ``browser_scrape(query, limit)`` is given it is a blocking fallback used when
+    the static page yields nothing; without it the site is static-only and fetch
+    errors are reported as the site's error.
+    """
+    search_url: Callable[[str], str]
+    parse_html: Callable[[str, int], List[dict]]
+    browser_scrape: Optional[Callable[[str, int], List[dict]]] = None
+
+
+class ScrapeEngine:
+    def __init__(
+        self,
+        sites: Dict[str, SiteSpec],
+        tier_stats: TierStats,
+        browser_workers: int = 3,
+        connect_timeout: float = DEFAULT_CONFIG['connect_timeout'],
+        read_timeout: float = DEFAULT_CONFIG['read_timeout'],
+        max_connections: int = DEFAULT_CONFIG['pool_maxsize']
+    ):
+        self.sites = sites
+        self.tier_stats = tier_stats
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_connections = max_connections
+
+        self._executor = ThreadPoolExecutor(max_workers=browser_workers, thread_name_prefix="selenium")
+        self._loop = None
+        self._thread = None
+        self._http = None
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------------- async API
+
+    async def fetch_html(self, url: str, required: bool = False) -> Optional[str]:
+        """Fetch a page on the event loop; ``None`` (or an error if ``required``) on a non-200"""
+        async with self._session().get(url) as response:
+            if response.status != 200:
+                if required:
+                    raise RuntimeError(f"{url} returned HTTP {response.status}")
+                logger.info(f"Static fetch of {url} returned HTTP {response.status}")
+                return None
+            return await response.text()
+
+    def tiers(self, site: str) -> Tuple[str, ...]:
+        """Fetch tiers a scrape of ``site`` may go through, in order"""
+        spec = self.sites.get(site)
+        return ("http",) if spec is None or spec.browser_scrape is None else ("http", "browser")
+
+    async def scrape_site(self, site: str, query: str, limit: int) -> Tuple[List[dict], str]:
+        """``(results, tier)``: static fetch first, then the browser fallback in the executor if it found nothing"""
+        spec = self.sites[site]
+        url = spec.search_url(query)
+
+        if spec.browser_scrape is None:
+            return spec.parse_html(await self.fetch_html(url, required=True), limit), "http"
+
+        if self.tier_stats.prefer_http(site):
+            try:
+                html = await self.fetch_html(url)
+                results = spec.parse_html(html, limit) if html else []
+            except Exception as e:
+                logger.info(f"{site} static fetch failed: {str(e)}")
+                results = []
+
+            self.tier_stats.record(site, "http", bool(results))
+            if results:
+                return results, "http"
+            logger.info(f"{site} static page had no results, escalating to the browser")
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self._executor, spec.browser_scrape, query, limit)
+        self.tier_stats.record(site, "browser", bool(results))
+        return results, "browser"
+
+    async def iter_search(
+        self,
+        query: str,
+        sellers: List[str],
+        limit: int,
+        site_timeouts: Dict[str, float],
+        total_timeout: float,
+        default_site_timeout: float = 30.0
+    ) -> AsyncIterator[SiteResult]:
+        """Scrape every seller concurrently, yielding each site's result as it finishes"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        async def run(site: str) -> SiteResult:
+            timeout = min(site_timeouts.get(site, default_site_timeout), total_timeout)
+            try:
+                results, tier = await asyncio.wait_for(self.scrape_site(site, query, limit), timeout)
+            except asyncio.TimeoutError:
+                elapsed = loop.time() - started
+                logger.warning(f"{site} scrape abandoned after {elapsed:.1f}s")
+                return SiteResult(site, error=f"Timed out after {elapsed:.1f}s", elapsed=elapsed, timed_out=True)
+            except Exception as e:
+                logger.error(f"{site} scrape failed: {str(e)}")
+                return SiteResult(site, error=str(e), elapsed=loop.time() - started)
+            return SiteResult(site, results=results or [], elapsed=loop.time() - started, tier=tier)
+
+        tasks = [asyncio.ensure_future(run(site)) for site in sellers if site in self.sites]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def search_all(self, query: str, sellers: List[str], limit: int,
+                         site_timeouts: Optional[Dict[str, float]] = None,
+                         total_timeout: float = 40.0) -> Dict[str, SiteResult]:
+        """Scrape every seller concurrently and return each site's result"""
+        return {
+            site_result.site: site_result
+            async for site_result in self.iter_search(query, sellers, limit, site_timeouts or {}, total_timeout)
+        }
+
+    # ---------------------------------------------------------------- sync API
+
+    def search_all_sync(self, query: str, sellers: List[str], limit: int,
+                        site_timeouts: Optional[Dict[str, float]] = None,
+                        total_timeout: float = 40.0) -> Dict[str, SiteResult]:
+        """Blocking wrapper around ``search_all`` for Flask views"""
+        future = asyncio.run_coroutine_threadsafe(
+            self.search_all(query, sellers, limit, site_timeouts, total_timeout),
+            self._ensure_loop()
+        )
+        return future.result()
+
+    def iter_search_sync(self, query: str, sellers: List[str], limit: int,
+                         site_timeouts: Dict[str, float], total_timeout: float) -> Iterator[SiteResult]:
+        """Blocking iterator over ``iter_search`` for Flask views and streaming responses"""
+        results = queue.Queue()
+
+        async def pump():
+            try:
+                async for site_result in self.iter_search(query, sellers, limit, site_timeouts, total_timeout):
+                    results.put(site_result)
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(_DONE)
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self._ensure_loop())
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+    def close(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            if self._http is not None:
+                asyncio.run_coroutine_threadsafe(self._http.close(), loop).result(timeout=5)
+                self._http = None
+            loop.call_soon_threadsafe(loop.stop)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ---------------------------------------------------------------- internals
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=loop.run_forever, name="scrape-engine", daemon=True)
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _session(self) -> aiohttp.ClientSession:
+        # Only ever called on the engine's loop thread, so no locking is needed
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                headers=BROWSER_HEADERS,
+                timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+        return self._http
@@ -1,93 +1,135 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-def detect_category(title):
-    title = title.lower()
-    if any(x in title for x in ["i5", "i7", "i9", "ryzen", "core"]): return "CPU"
-    if any(x in title for x in ["rtx", "gtx", "radeon", "gpu"]): return "GPU"
-    if "ram" in title or "ddr" in title: return "RAM"
-    if "case" in title or "cabinet" in title: return "Case"
-    if "cooler" in title or "fan" in title or "aio" in title: return "Cooling"
-    if "monitor" in title or "display" in title: return "Monitor"
-    if "keyboard" in title or "mouse" in title or "accessory" in title: return "Accessories"
-    if "ssd" in title or "hdd" in title or "nvme" in title: return "Storage"
-    if "motherboard" in title or any(x in title for x in ["b660", "z790", "h610"]): return "Motherboard"
-    if "psu" in title or "power supply" in title: return "PSU"
-    return "Other"
-
-def scrape_flipkart(driver, query):
-    print("Scraping Flipkart...")
+from selectolax.lexbor import LexborHTMLParser
+
+from .categories import classify
+from .prices import price_fields
+from .tiers import fetch_html
+from .tabs import TabJob
+from .waits import wait_for_results
+
+BLOCK_SELECTOR = "div[data-id]"
+LOGIN_POPUP_CLOSE = "//button[contains(text(), '✕')]"
+
+# Fallback selectors for each field, tried together as one selector group so a
+# single lookup returns the first match in document order
+SELECTOR_CHAIN = {
+    "title": ", ".join(["a.IRpwTa", "a.s1Q9rs", "div._4rR01T", "a._2rpwqI"]),
+    "price": ", ".join(["div._30jeq3", "div._25b18c div._30jeq3", "div.Nx9bqj"]),
+    "link": ", ".join(["a._1fQZEK", "a.s1Q9rs", "a._2rpwqI"]),
+}
+
+def search_url(query):
+    return f"https://www.flipkart.com/search?q={query.replace(' ', '%20')}"
+
+def absolute_link(href):
+    if not href:
+        return "#"
+    return href if href.startswith("http") else "https://www.flipkart.com" + href
+
+def make_product(title, price, link):
+    title = title[:80] + "..." if len(title) > 80 else title
+    category = classify(title)
+    print(f"[Flipkart] {title} - {price} - {link} - {category}")
+    return {
+        "site": "Flipkart",
+        "title": title,
+        **price_fields(price),
+        "link": link,
+        "category": category
+    }
+
+def parse_flipkart_html(html, limit=10):
+    """Extract search results from a page_source snapshot in a single parse"""
+    parser = LexborHTMLParser(html)
+    blocks = parser.css(BLOCK_SELECTOR)
+    print(f"[INFO] Found {len(blocks)} product blocks.")
+
     products = []
-    
-    url = f"https://www.flipkart.com/search?q={query.replace(' ', '%20')}"
-    driver.get(url)
+    for block in blocks[:limit]:
+        title_node = block.css_first(SELECTOR_CHAIN["title"])
+        title = title_node.text().strip() if title_node else ""
+        if not title:
+            continue
 
-    # Handle login popup if it appears
-    try:
-        close_btn = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.XPATH, "//button[contains(text(), '✕')]"))
-        )
-        close_btn.click()
-        print("[INFO] Closed login popup.")
-    except:
-        print("[INFO] No login popup detected.")
+        price_node = block.css_first(SELECTOR_CHAIN["price"])
+        price = price_node.text().strip() if price_node else "N/A"
 
-    try:
-        # Wait for product blocks to appear
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-id]"))
-        )
-        blocks = driver.find_elements(By.CSS_SELECTOR, "div[data-id]")
-    except Exception as e:
-        print(f"[ERROR] Flipkart results did not load: {e}")
-        return []
+        link_node = block.css_first(SELECTOR_CHAIN["link"])
+        link = absolute_link(link_node.attributes.get("href") if link_node else None)
 
+        products.append(make_product(title, price, link))
+
+    return products
+
+def extract_flipkart_elements(driver, limit=10):
+    """Extract search results with one WebDriver round trip per field"""
+    blocks = driver.find_elements(By.CSS_SELECTOR, BLOCK_SELECTOR)
     print(f"[INFO] Found {len(blocks)} product blocks.")
 
-    for block in blocks[:10]:  # Limit to 10 products
+    products = []
+    for block in blocks[:limit]:
         try:
-            # Title extraction
             title = None
             try:
-                title = block.find_element(By.CSS_SELECTOR, "a.IRpwTa, a.s1Q9rs, div._4rR01T, a._2rpwqI").text.strip()
+                title = block.find_element(By.CSS_SELECTOR, SELECTOR_CHAIN["title"]).text.strip()
             except:
                 pass
-                
+
             if not title:
                 continue
-            title = title[:80] + "..." if len(title) > 80 else title
 
-            # Price extraction
             price = "N/A"
             try:
-                price = block.find_element(By.CSS_SELECTOR, "div._30jeq3, div._25b18c div._30jeq3, div.Nx9bqj").text.strip()
+                price = block.find_element(By.CSS_SELECTOR, SELECTOR_CHAIN["price"]).text.strip()
             except:
                 pass
 
-            # Link extraction
             link = "#"
             try:
-                a_tag = block.find_element(By.CSS_SELECTOR, "a._1fQZEK, a.s1Q9rs, a._2rpwqI")
-                link = a_tag.get_attribute("href")
-                if not link.startswith("http"):
-                    link = "https://www.flipkart.com" + link
+                link = absolute_link(block.find_element(By.CSS_SELECTOR, SELECTOR_CHAIN["link"]).get_attribute("href"))
             except:
                 pass
 
-            category = detect_category(title)
-            print(f"[Flipkart] {title} - {price} - {link} - {category}")
-
-            products.append({
-                "site": "Flipkart",
-                "title": title,
-                "price": price,
-                "link": link,
-                "category": category
-            })
+            products.append(make_product(title, price, link))
 
         except Exception as e:
             print(f"[WARN] Failed to parse a product block: {e}")
             continue
 
-    return products
\ No newline at end of file
+    return products
+
+def scrape_flipkart_http(query, limit=10):
+    """Scrape Flipkart search results from the static page, without a browser"""
+    print("Scraping Flipkart (static)...")
+    html = fetch_html(search_url(query))
+    return parse_flipkart_html(html, limit) if html else []
+
+def flipkart_tab_job(query, limit=10):
+    """Describe a Flipkart search for the multi-tab scraper"""
+    return TabJob(
+        search_url(query),
+        BLOCK_SELECTOR,
+        lambda html: parse_flipkart_html(html, limit),
+        dismiss_xpath=LOGIN_POPUP_CLOSE
+    )
+
+def scrape_flipkart(driver, query, mode="page_source", timeout=15):
+    """Scrape Flipkart search results.
+
+    ``mode="page_source"`` (the default) parses one HTML snapshot locally;
+    ``mode="elements"`` walks the product blocks through WebDriver calls.
+    ``timeout`` bounds the wait for the product blocks.
+    """
+    print("Scraping Flipkart...")
+    driver.get(search_url(query))
+
+    try:
+        # Wait for product blocks, closing the login popup on the way if it shows up
+        wait_for_results(driver, BLOCK_SELECTOR, timeout, dismiss_xpath=LOGIN_POPUP_CLOSE)
+    except Exception as e:
+        print(f"[ERROR] Flipkart results did not load: {e}")
+        return []
+
+    if mode == "elements":
+        return extract_flipkart_elements(driver)
+    return parse_flipkart_html(driver.page_source)
@@ -1,10 +1,14 @@
 import re
-import time
 from selenium import webdriver
+from selectolax.lexbor import LexborHTMLParser
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+from .categories import classify
+from .prices import price_fields
+from .tiers import fetch_html
+from .tabs import TabJob
+from .waits import wait_for_results
 
 def init_driver(headless=True):
     options = Options()
@@ -13,81 +17,168 @@ def init_driver(headless=True):
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    options.page_load_strategy = "eager"
     return webdriver.Chrome(options=options)
 
-def detect_category(title: str) -> str:
-    title = title.lower()
-    if any(x in title for x in ["i3", "i5", "i7", "i9", "ryzen", "core"]): return "CPU"
-    if any(x in title for x in ["gtx", "rtx", "radeon"]): return "GPU"
-    if "ram" in title or "ddr" in title: return "RAM"
-    if "motherboard" in title or any(x in title for x in ["b660", "z790", "h610"]): return "Motherboard"
-    if any(x in title for x in ["ssd", "nvme", "hdd"]): return "Storage"
-    if "psu" in title or "power supply" in title: return "PSU"
-    if "case" in title or "cabinet" in title: return "Case"
-    if "fan" in title or "cooling" in title or "aio" in title: return "Cooling"
-    if "monitor" in title: return "Monitor"
-    return "Other"
-
-def scrape_mdcomputers(query: str, limit: int = 10) -> list[dict]:
-    print(f"[INFO] MDComputers • scraping '{query}'")
-    driver = init_driver()
+PRODUCT_LINK_SELECTOR = "a[href*='/product/']"
+PRICE_PATTERN = re.compile(r"₹\s?[\d,]+")
+
+# Elements that wrap a single product card in the store's listing templates
+CARD_CLASSES = ("product-layout", "product-thumb", "product-item", "product-grid-item")
+
+def search_url(query):
+    return f"https://mdcomputers.in/?route=product/search&search={query.replace(' ', '%20')}"
+
+def is_card(node) -> bool:
+    if node.tag == "li":
+        return True
+    classes = (node.attributes.get("class") or "").split()
+    return any(cls in CARD_CLASSES for cls in classes)
+
+def find_card(anchor):
+    node = anchor.parent
+    while node is not None and node.tag not in ("body", "html"):
+        if is_card(node):
+            return node
+        node = node.parent
+    return None
+
+def find_price(text) -> str:
+    match = PRICE_PATTERN.search(text or "")
+    return match.group(0) if match else "N/A"
+
+def card_price(card) -> str:
+    # Prefer the discounted price when the card shows both
+    for selector in (".price-new", ".price"):
+        node = card.css_first(selector)
+        if node is not None:
+            price = find_price(node.text())
+            if price != "N/A":
+                return price
+    return find_price(card.text(separator=" "))
+
+def make_product(title, price, href):
+    return {
+        "site": "mdcomputers",
+        "title": title[:80] + ("..." if len(title) > 80 else ""),
+        **price_fields(price),
+        "link": href,
+        "category": classify(title),
+    }
+
+def parse_mdcomputers_html(html: str, limit: int = 10) -> list[dict]:
+    """Pair every product title with its price in one walk over a page snapshot"""
+    parser = LexborHTMLParser(html)
     products = []
     seen = set()
+    used_cards = set()
 
-    try:
-        search_url = f"https://mdcomputers.in/?route=product/search&search={query.replace(' ', '%20')}"
-        driver.get(search_url)
-
-        # Wait until product titles load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/product/']"))
-        )
+    for a in parser.css(PRODUCT_LINK_SELECTOR):
+        if len(products) >= limit:
+            break
 
-        # Collect all anchor tags pointing to products
-        anchors = driver.find_elements(By.CSS_SELECTOR, "a[href*='/product/']")
+        title = a.text().strip()
+        href = a.attributes.get("href")
 
-        for a in anchors:
-            if len(products) >= limit:
-                break
+        if not title or title.lower().startswith("add to cart") or not href:
+            continue
 
-            title = a.text.strip()
-            href = a.get_attribute("href")
+        key = (title, href)
+        if key in seen:
+            continue
 
-            if not title or title.lower().startswith("add to cart") or not href:
+        # Each card yields one product: its first titled link (compare/wishlist links follow it)
+        card = find_card(a)
+        if card is not None:
+            if card.mem_id in used_cards:
                 continue
+            used_cards.add(card.mem_id)
+        seen.add(key)
+
+        # A price printed right after the title wins; otherwise use the card's price
+        sibling = a.next
+        while sibling is not None and sibling.tag == "-text" and not sibling.text().strip():
+            sibling = sibling.next
+        price = find_price(sibling.text()) if sibling is not None else "N/A"
+        if price == "N/A" and card is not None:
+            price = card_price(card)
+
+        products.append(make_product(title, price, href))
+
+    return products
+
+def extract_mdcomputers_elements(driver, limit: int = 10) -> list[dict]:
+    """Pair titles with prices through per-anchor XPath lookups on the live page"""
+    products = []
+    seen = set()
 
-            # Try to find price near the anchor
-            price = "N/A"
+    for a in driver.find_elements(By.CSS_SELECTOR, PRODUCT_LINK_SELECTOR):
+        if len(products) >= limit:
+            break
+
+        title = a.text.strip()
+        href = a.get_attribute("href")
+
+        if not title or title.lower().startswith("add to cart") or not href:
+            continue
+
+        price = "N/A"
+        try:
+            price = find_price(a.find_element(By.XPATH, "following-sibling::*[1]").text)
+        except:
             try:
-                price_el = a.find_element(By.XPATH, "following-sibling::*[1]")
-                match = re.search(r"₹\s?[\d,]+", price_el.text)
-                if match:
-                    price = match.group(0)
+                price = find_price(a.find_element(By.XPATH, "ancestor::li").text)
             except:
-                try:
-                    ctx = a.find_element(By.XPATH, "ancestor::li").text
-                    match = re.search(r"₹\s?[\d,]+", ctx)
-                    if match:
-                        price = match.group(0)
-                except:
-                    pass
-
-            key = (title, href)
-            if key in seen:
-                continue
-            seen.add(key)
+                pass
+
+        key = (title, href)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        products.append(make_product(title, price, href))
+
+    return products
+
+def scrape_mdcomputers_http(query: str, limit: int = 10) -> list[dict]:
+    """Scrape MD Computers search results from the static page, without a browser"""
+    print(f"[INFO] MDComputers • static fetch for '{query}'")
+    html = fetch_html(search_url(query))
+    return parse_mdcomputers_html(html, limit) if html else []
+
+def mdcomputers_tab_job(query: str, limit: int = 10) -> TabJob:
+    """Describe an MD Computers search for the multi-tab scraper"""
+    return TabJob(search_url(query), PRODUCT_LINK_SELECTOR, lambda html: parse_mdcomputers_html(html, limit))
 
-            products.append({
-                "site": "mdcomputers",
-                "title": title[:80] + ("..." if len(title) > 80 else ""),
-                "price": price,
-                "link": href,
-                "category": detect_category(title),
-            })
+def scrape_mdcomputers(query: str, limit: int = 10, driver=None, html: str = None, mode: str = "page_source",
+                      timeout: float = 10) -> list[dict]:
+    """Scrape MD Computers search results.
+
+    Pass ``html`` to parse an already-fetched page, or ``driver`` to reuse a
+    caller's browser; without either a private headless Chrome is started.
+    ``timeout`` bounds the wait for product titles.
+    """
+    print(f"[INFO] MDComputers • scraping '{query}'")
+    if html is not None:
+        return parse_mdcomputers_html(html, limit)
+
+    own_driver = driver is None
+    if own_driver:
+        driver = init_driver()
+
+    try:
+        driver.get(search_url(query))
+
+        # Wait until product titles load
+        wait_for_results(driver, PRODUCT_LINK_SELECTOR, timeout)
+
+        if mode == "elements":
+            return extract_mdcomputers_elements(driver, limit)
+        return parse_mdcomputers_html(driver.page_source, limit)
 
     except Exception as e:
         print(f"[ERROR] {e}")
+        return []
     finally:
-        driver.quit()
-
-    return products
+        if own_driver:
+            driver.quit()
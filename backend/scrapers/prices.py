@@ -0,0 +1,70 @@
+"""Scraped price text -> integer paise, currency and the original text"""
+import math
+import re
+from typing import Dict, Optional, Union
+
+DEFAULT_CURRENCY = "INR"
+
+# Symbols and codes the supported sellers print next to prices
+CURRENCY_MARKERS = {
+    "₹": "INR",
+    "rs": "INR",
+    "inr": "INR",
+    "$": "USD",
+    "usd": "USD",
+}
+
+_PRICE_PATTERN = re.compile(
+    r"(?P<currency>₹|\$|\brs\b\.?|\binr\b|\busd\b)?\s*"
+    r"(?P<amount>\d{1,3}(?:,\d{2,3})+|\d+)(?:\.(?P<fraction>\d{1,2}))?",
+    re.IGNORECASE
+)
+
+
+def normalize_price(raw: Union[str, int, float, None], currency: str = DEFAULT_CURRENCY) -> Dict:
+    """Parse a scraped price ("₹12,499", "Rs. 1,23,456.50", "12,499.", 12499.0, "N/A").
+
+    Returns ``{"paise", "currency", "present", "raw"}``; ``paise`` is ``None`` and
+    ``present`` false when no positive amount could be read. Numbers are taken
+    as already being in rupees; NaN and infinities count as missing.
+    """
+    if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+        if not math.isfinite(raw):
+            return {"paise": None, "currency": currency, "present": False, "raw": raw}
+        paise = round(raw * 100)
+        return {"paise": paise if paise > 0 else None, "currency": currency, "present": paise > 0, "raw": raw}
+
+    text = (raw or "").strip()
+    match = _PRICE_PATTERN.search(text)
+    if not match:
+        return {"paise": None, "currency": currency, "present": False, "raw": text}
+
+    marker = (match.group("currency") or "").lower().rstrip(".")
+    paise = int(match.group("amount").replace(",", "")) * 100
+    fraction = match.group("fraction")
+    if fraction:
+        paise += int(fraction.ljust(2, "0"))
+    return {
+        "paise": paise if paise > 0 else None,
+        "currency": CURRENCY_MARKERS.get(marker, currency),
+        "present": paise > 0,
+        "raw": text
+    }
+
+
+def price_fields(raw: Union[str, int, float, None]) -> Dict:
+    """Product fields for a scraped price: numeric ``price`` in rupees plus the structured parts"""
+    price = normalize_price(raw)
+    return {
+        "price": price["paise"] / 100 if price["present"] else None,
+        "price_paise": price["paise"],
+        "currency": price["currency"],
+        "price_present": price["present"],
+        "price_raw": price["raw"]
+    }
+
+
+def price_value(value: Union[str, int, float, None]) -> Optional[float]:
+    """Rupee amount of a price that may still be raw text (``None`` if there is none)"""
+    price = normalize_price(value)
+    return price["paise"] / 100 if price["present"] else None
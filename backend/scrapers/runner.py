@@ -0,0 +1,91 @@
+"""Fan-out executor that runs each seller's scraper on its own worker"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SiteResult:
+    """Outcome of a single seller's scrape"""
+    site: str
+    results: List[dict] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    timed_out: bool = False
+    skipped: bool = False
+    # Which fetch tier ("http" or "browser") produced the outcome, when known
+    tier: Optional[str] = None
+
+    def summary(self) -> dict:
+        return {
+            "count": len(self.results),
+            "elapsed": round(self.elapsed, 3),
+            "error": self.error,
+            "timed_out": self.timed_out,
+            "skipped": self.skipped
+        }
+
+
+def iter_site_results(
+    jobs: Dict[str, Callable[[], List[dict]]],
+    site_timeouts: Dict[str, float],
+    total_timeout: float,
+    default_site_timeout: float = 30.0
+) -> Iterator[SiteResult]:
+    """Run every job concurrently and yield each site's result as soon as it finishes.
+
+    A site that misses its own deadline (or the overall one) is reported as timed out
+    and abandoned; its worker keeps running in the background so it can still clean
+    up its browser, but nothing waits for it.
+    """
+    if not jobs:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="scrape")
+    started = time.monotonic()
+    overall_deadline = started + total_timeout
+    futures = {}
+    for site, job in jobs.items():
+        deadline = min(started + site_timeouts.get(site, default_site_timeout), overall_deadline)
+        futures[executor.submit(job)] = (site, deadline)
+
+    pending = set(futures)
+    try:
+        while pending:
+            next_deadline = min(futures[f][1] for f in pending)
+            done, _ = wait(
+                pending,
+                timeout=max(0.0, next_deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                pending.discard(future)
+                site = futures[future][0]
+                elapsed = time.monotonic() - started
+                try:
+                    results = future.result() or []
+                except Exception as e:
+                    logger.error(f"{site} scrape failed: {str(e)}")
+                    yield SiteResult(site, error=str(e), elapsed=elapsed)
+                else:
+                    yield SiteResult(site, results=results, elapsed=elapsed)
+
+            now = time.monotonic()
+            for future in [f for f in pending if futures[f][1] <= now]:
+                pending.discard(future)
+                future.cancel()
+                site = futures[future][0]
+                logger.warning(f"{site} scrape abandoned after {now - started:.1f}s")
+                yield SiteResult(
+                    site,
+                    error=f"Timed out after {now - started:.1f}s",
+                    elapsed=now - started,
+                    timed_out=True
+                )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,78 @@
+"""Shared, connection-pooled HTTP session for the HTTP-based scrapers"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# urllib3 only decodes brotli when one of these is installed, so only ask for it then
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-IN,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING
+}
+
+DEFAULT_CONFIG = {
+    'connect_timeout': 5.0,
+    'read_timeout': 15.0,
+    'pool_connections': 10,
+    'pool_maxsize': 20,
+    'max_retries': 1
+}
+
+_lock = threading.Lock()
+_config = dict(DEFAULT_CONFIG)
+_session = None
+
+
+def configure_http(**config):
+    """Override session settings; the next ``get_session()`` builds a fresh session"""
+    global _session
+    unknown = set(config) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"Unknown HTTP settings: {', '.join(sorted(unknown))}")
+
+    with _lock:
+        _config.update({key: value for key, value in config.items() if value is not None})
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+def get_session() -> requests.Session:
+    """Process-wide session whose keep-alive connections are reused across searches"""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_config['pool_connections'],
+                pool_maxsize=_config['pool_maxsize'],
+                max_retries=_config['max_retries']
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(BROWSER_HEADERS)
+            _session = session
+        return _session
+
+
+def get_timeout() -> tuple:
+    with _lock:
+        return _config['connect_timeout'], _config['read_timeout']
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session with the configured connect/read timeouts"""
+    kwargs.setdefault('timeout', get_timeout())
+    return get_session().get(url, **kwargs)
@@ -0,0 +1,114 @@
+"""Scrape several sellers at once from one browser, one tab per seller"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .runner import SiteResult
+from .waits import StableCount, poll_results
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TabJob:
+    """Everything needed to load and harvest one seller's search page in a tab"""
+    url: str
+    ready_selector: str
+    parse: Callable[[str], List[dict]]
+    dismiss_xpath: Optional[str] = None
+
+
+def scrape_in_tabs(
+    driver,
+    jobs: Dict[str, TabJob],
+    site_timeouts: Dict[str, float],
+    default_site_timeout: float = 30.0,
+    prepare: Optional[Callable] = None,
+    stable_for: float = 0.3,
+    poll: float = 0.1,
+    started: Optional[float] = None
+) -> Iterator[SiteResult]:
+    """Start every navigation at once, then harvest each tab as its results settle.
+
+    ``prepare(driver, site)`` runs in each tab before it navigates (e.g. to install
+    a resource blocklist). Tabs other than the driver's original one are closed
+    when done, so the driver can go back to its pool afterwards.
+    """
+    if not jobs:
+        return
+
+    started = time.monotonic() if started is None else started
+    original = driver.current_window_handle
+    handles = {}
+
+    try:
+        # Open and prepare every tab first, then fire off the navigations back to back
+        for index, site in enumerate(jobs):
+            if index:
+                driver.switch_to.new_window('tab')
+            handles[site] = driver.current_window_handle
+            if prepare is not None:
+                prepare(driver, site)
+
+        for site, handle in handles.items():
+            driver.switch_to.window(handle)
+            # Assigning location returns immediately, unlike driver.get()
+            driver.execute_script("window.location.href = arguments[0];", jobs[site].url)
+
+        pending = dict(handles)
+        readiness = {site: StableCount(stable_for) for site in jobs}
+        deadlines = {
+            site: started + site_timeouts.get(site, default_site_timeout)
+            for site in jobs
+        }
+
+        while pending:
+            for site, handle in list(pending.items()):
+                job = jobs[site]
+                driver.switch_to.window(handle)
+                try:
+                    count = poll_results(driver, job.ready_selector, job.dismiss_xpath)
+                except Exception as e:
+                    # The page is mid-navigation; try again on the next round
+                    logger.debug(f"{site} tab not ready: {str(e)}")
+                    count = 0
+
+                now = time.monotonic()
+                ready = readiness[site].update(count, now)
+                if not ready and now < deadlines[site]:
+                    continue
+
+                del pending[site]
+                if not count:
+                    yield SiteResult(
+                        site,
+                        error=f"Timed out after {now - started:.1f}s",
+                        elapsed=now - started,
+                        timed_out=True
+                    )
+                    continue
+
+                try:
+                    results = job.parse(driver.page_source)
+                except Exception as e:
+                    logger.error(f"{site} tab parse failed: {str(e)}")
+                    yield SiteResult(site, error=str(e), elapsed=time.monotonic() - started)
+                else:
+                    yield SiteResult(site, results=results, elapsed=time.monotonic() - started)
+
+            if pending:
+                time.sleep(poll)
+    finally:
+        for handle in handles.values():
+            if handle == original:
+                continue
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception as e:
+                logger.error(f"Error closing scraper tab: {str(e)}")
+        try:
+            driver.switch_to.window(original)
+        except Exception as e:
+            logger.error(f"Error returning to the original tab: {str(e)}")
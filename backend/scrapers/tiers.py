@@ -0,0 +1,70 @@
+"""Tiered fetching: plain HTTP first, a real browser only when the static page isn't enough"""
+import logging
+import threading
+from typing import Optional
+
+from .session import http_get
+
+logger = logging.getLogger(__name__)
+
+TIERS = ("http", "browser")
+
+
+def fetch_html(url: str) -> Optional[str]:
+    """Fetch a page without a browser; ``None`` when the site didn't serve it"""
+    response = http_get(url)
+    if response.status_code != 200:
+        logger.info(f"Static fetch of {url} returned HTTP {response.status_code}")
+        return None
+    return response.text
+
+
+class TierStats:
+    """Per-site record of how often each fetch tier produced results.
+
+    Once a site has shown that its static pages are useless (e.g. it always
+    serves a JS shell or a captcha), the HTTP tier is only re-probed every
+    ``probe_every`` searches instead of being tried first each time.
+    """
+    def __init__(self, min_attempts: int = 20, min_success_rate: float = 0.1, probe_every: int = 10):
+        self.min_attempts = min_attempts
+        self.min_success_rate = min_success_rate
+        self.probe_every = probe_every
+        self._sites = {}
+        self._skipped = {}
+        self._lock = threading.Lock()
+
+    def record(self, site: str, tier: str, success: bool):
+        with self._lock:
+            tiers = self._sites.setdefault(site, {t: {"attempts": 0, "successes": 0} for t in TIERS})
+            tiers[tier]["attempts"] += 1
+            if success:
+                tiers[tier]["successes"] += 1
+
+    def prefer_http(self, site: str) -> bool:
+        with self._lock:
+            http = self._sites.get(site, {}).get("http")
+            if not http or http["attempts"] < self.min_attempts:
+                return True
+            if http["successes"] / http["attempts"] >= self.min_success_rate:
+                return True
+
+            skipped = self._skipped.get(site, 0) + 1
+            if skipped >= self.probe_every:
+                self._skipped[site] = 0
+                return True
+            self._skipped[site] = skipped
+            return False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                site: {
+                    tier: {
+                        **counts,
+                        "success_rate": round(counts["successes"] / counts["attempts"], 3) if counts["attempts"] else None
+                    }
+                    for tier, counts in tiers.items()
+                }
+                for site, tiers in self._sites.items()
+            }
@@ -0,0 +1,81 @@
+"""Readiness waits for pages loaded with the "eager" page-load strategy"""
+import logging
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# One round trip per poll: dismiss an overlay if it is showing, then count results
+_POLL_SCRIPT = """
+const selector = arguments[0];
+const dismissXpath = arguments[1];
+let dismissed = false;
+if (dismissXpath) {
+    const button = document.evaluate(
+        dismissXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (button) {
+        button.click();
+        dismissed = true;
+    }
+}
+return [document.querySelectorAll(selector).length, dismissed];
+"""
+
+
+def poll_results(driver, selector: str, dismiss_xpath: str = None) -> int:
+    """Count current matches for ``selector``, clicking away a popup first if one is showing"""
+    count, dismissed = driver.execute_script(_POLL_SCRIPT, selector, dismiss_xpath)
+    if dismissed:
+        print("[INFO] Closed login popup.")
+    return count
+
+
+class StableCount:
+    """Tracks when a match count is non-zero and has stopped changing"""
+    def __init__(self, stable_for: float = 0.3):
+        self.stable_for = stable_for
+        self.last_count = 0
+        self.stable_since = None
+
+    def update(self, count: int, now: float) -> bool:
+        if count and count == self.last_count:
+            if self.stable_since is None:
+                self.stable_since = now
+            ready = now - self.stable_since >= self.stable_for
+        else:
+            self.stable_since = None
+            ready = False
+        self.last_count = count
+        return ready
+
+
+def wait_for_results(driver, selector: str, timeout: float, stable_for: float = 0.3,
+                     poll: float = 0.1, dismiss_xpath: str = None) -> int:
+    """Wait until ``selector`` matches something and the match count stops changing.
+
+    When ``dismiss_xpath`` is given, a popup matching it is clicked away on the same
+    poll that checks for results, so a popup that never appears costs nothing.
+    A poll that fails (the page is mid-navigation, its context was replaced)
+    counts as no results and polling goes on until the deadline.
+    Returns the final match count; raises ``TimeoutException`` if nothing showed up.
+    """
+    deadline = time.monotonic() + timeout
+    stable = StableCount(stable_for)
+
+    while True:
+        try:
+            count = poll_results(driver, selector, dismiss_xpath)
+        except WebDriverException as e:
+            logger.debug(f"Results poll for {selector!r} failed: {str(e)}")
+            count = 0
+        now = time.monotonic()
+        if stable.update(count, now):
+            return count
+
+        if now >= deadline:
+            if count:
+                return count
+            raise TimeoutException(f"No elements matched {selector!r} within {timeout}s")
+        time.sleep(poll)
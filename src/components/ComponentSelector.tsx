@@ -53,6 +53,7 @@ function debounce<T extends (...args: any[]) => any>(func: T, wait: number) {
 }
 
 const API_BASE = 'http://localhost:5001/api';
+const CATALOG_PAGE_SIZE = 50;
 
 export default function ComponentSelector({ components = [], onChange }: ComponentSelectorProps) {
   const [searchTerm, setSearchTerm] = useState('');
@@ -75,6 +76,8 @@ export default function ComponentSelector({ components = [], onChange }: Compone
   const [editingCatalogComponentId, setEditingCatalogComponentId] = useState<string | null>(null);
   const [showLiveSearch, setShowLiveSearch] = useState(false);
   const [backendComponents, setBackendComponents] = useState<Component[]>([]);
+  const [catalogTotal, setCatalogTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [successMessage, setSuccessMessage] = useState<string | null>(null);
@@ -104,7 +107,8 @@ export default function ComponentSelector({ components = [], onChange }: Compone
     }
   };
 
-  const refreshComponents = useCallback(async (search = '', category = 'All') => {
+  // The server searches, filters and pages the catalog; pass a cursor to append the next page
+  const refreshComponents = useCallback(async (search = '', category = 'All', cursor: string | null = null) => {
     try {
       setLoading(true);
       setError('');
@@ -113,6 +117,8 @@ export default function ComponentSelector({ components = [], onChange }: Compone
       const params = new URLSearchParams();
       if (search) params.append('search', search);
       if (category !== 'All') params.append('category', category);
+      params.append('limit', String(CATALOG_PAGE_SIZE));
+      if (cursor) params.append('cursor', cursor);
       
       const url = `${API_BASE}/components?${params.toString()}`;
       
@@ -120,12 +126,13 @@ export default function ComponentSelector({ components = [], onChange }: Compone
       if (!response.ok) throw new Error('Failed to fetch components');
       
       const data = await response.json();
-      setBackendComponents(data.components?.map((comp: any) => ({
+      const page: Component[] = data.components?.map((comp: any) => ({
         ...comp,
         id: comp.id || uuidv4()
-      })) || []);
-      
-    
+      })) || [];
+      setBackendComponents(prev => cursor ? [...prev, ...page] : page);
+      setCatalogTotal(data.total ?? page.length);
+      setNextCursor(data.next_cursor ?? null);
     } catch (err) {
       console.error('Refresh failed:', err);
       setError(err instanceof Error ? err.message : 'Failed to refresh components');
@@ -184,9 +191,7 @@ useEffect(() => {
         }
 
         // Refresh the components from the backend
-        const fetchResponse = await fetch(`${API_BASE}/components`);
-        const data = await fetchResponse.json();
-        setBackendComponents(data.components || []);
+        await refreshComponents(searchTerm, selectedCategory);
         
         setSuccessMessage('Components imported successfully!');
         setError('');
@@ -208,31 +213,8 @@ useEffect(() => {
   }, [successMessage]);
 
   useEffect(() => {
-    const fetchComponents = async () => {
-      setLoading(true);
-      setError('');
-      try {
-        const response = await fetch(`${API_BASE}/components`);
-        if (!response.ok) {
-          const errorData = await response.json().catch(() => ({}));
-          throw new Error(errorData.error || 'Failed to fetch components');
-        }
-        const data = await response.json();
-        if (data.success) {
-          setBackendComponents(data.components || []);
-        } else {
-          throw new Error(data.error || 'Invalid response format');
-        }
-      } catch (err) {
-        console.error('Fetch error:', err);
-        setError(err instanceof Error ? err.message : 'Failed to fetch components');
-        setBackendComponents([]);
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchComponents();
-  }, []); 
+    refreshComponents();
+  }, [refreshComponents]);
 
   const detectCategory = (title: string | undefined | null) => {
     if (!title) return 'Other';
@@ -250,29 +232,8 @@ useEffect(() => {
     return 'Other';
   };
 
-const filteredSampleComponents = useMemo(() => {
-  if (!backendComponents || !Array.isArray(backendComponents)) return [];
-  
-  return backendComponents.filter(component => {
-    if (!component) return false;
-    
-    const name = component.name?.toLowerCase() || '';
-    const brand = component.brand?.toLowerCase() || '';
-    const category = component.category?.toLowerCase() || '';
-    const searchLower = searchTerm.toLowerCase();
-
-    const matchesSearch = 
-      name.includes(searchLower) ||
-      brand.includes(searchLower) ||
-      category.includes(searchLower);
-    
-    const matchesCategory = 
-      selectedCategory === 'All' || 
-      component.category === selectedCategory;
-
-    return matchesSearch && matchesCategory;
-  });
-}, [searchTerm, selectedCategory, backendComponents]);
+// Already searched and filtered by the server
+const filteredSampleComponents = backendComponents;
 
 const addComponent = (componentData: Component) => {
   // Validate required fields
@@ -813,7 +774,7 @@ const addComponent = (componentData: Component) => {
   </select>
 </div>
 
-    {loading ? (
+    {loading && backendComponents.length === 0 ? (
       <div className="text-center py-4">Loading components...</div>
     ) : filteredSampleComponents.length === 0 ? (
       <div className="text-center py-4">
@@ -868,6 +829,15 @@ const addComponent = (componentData: Component) => {
             </div>
           </div>
         ))}
+        {nextCursor && (
+          <button
+            onClick={() => refreshComponents(searchTerm, selectedCategory, nextCursor)}
+            className="w-full py-2 text-sm text-blue-600 hover:bg-blue-50 rounded-md transition-colors"
+            disabled={loading}
+          >
+            Load more ({backendComponents.length} of {catalogTotal})
+          </button>
+        )}
       </div>
     )}
   </div>
@@ -9,7 +9,8 @@ interface ProductSearchProps {
 
 interface ScrapedProduct {
   title: string;
-  price: string | number;
+  // Rupees, parsed by the backend; null when the listing showed no price
+  price: number | null;
   link: string;
   site?: string;
   warranty?: string;
@@ -107,9 +108,7 @@ export default function ProductSearch({
 
       const formattedProducts = data.results.map((item: any) => ({
         title: item.title || item.name || 'Unknown Product',
-        price: typeof item.price === 'string' 
-          ? parseFloat(item.price.replace(/[^\d.]/g, '')) 
-          : item.price || 0,
+        price: item.price ?? null,
         link: item.link || '#',
         site: 'bing',
         brand: item.brand || extractBrandFromTitle(item.title || item.name || ''),
@@ -137,37 +136,61 @@ export default function ProductSearch({
     setLoading(true);
     setError('');
 
+    // Bing has its own endpoint; run it alongside the streamed search
+    const bingSearch = selectedSeller === 'all' || selectedSeller === 'bing'
+      ? fetchBingResults(query)
+      : Promise.resolve();
+
     try {
       if (selectedSeller !== 'bing') {
-        const response = await fetch(
-          `${apiBaseUrl}/search?query=${encodeURIComponent(query)}&seller=${selectedSeller === 'all' ? 'amazon,flipkart,mdcomputers' : selectedSeller}`
-        );
-
-        const data = await response.json();
-        
-        if (!response.ok) {
-          throw new Error(data.error || 'Search failed');
-        }
-
-        const formattedProducts = data.results.map((item: any) => ({
+        const formatProduct = (item: any): ScrapedProduct => ({
           title: item.title || item.name || 'Unknown Product',
-          price: typeof item.price === 'string' 
-            ? parseFloat(item.price.replace(/[^\d.]/g, '')) 
-            : item.price || 0,
+          price: item.price ?? null,
           link: item.link || '#',
           site: item.site || selectedSeller,
           brand: extractBrandFromTitle(item.title || item.name || ''),
           category: detectCategory(item.title || item.name || ''),
           warranty: item.warranty || '1 year',
           seller: item.seller || ''
-        }));
+        });
 
-        setProducts(formattedProducts);
-      }
+        // Results arrive one seller at a time as newline-delimited JSON events
+        setProducts([]);
+        const response = await fetch(
+          `${apiBaseUrl}/search/stream?query=${encodeURIComponent(query)}&seller=${selectedSeller === 'all' ? 'amazon,flipkart,mdcomputers' : selectedSeller}`
+        );
 
-      if (selectedSeller === 'all' || selectedSeller === 'bing') {
-        await fetchBingResults(query);
+        if (!response.ok || !response.body) {
+          const data = await response.json().catch(() => ({}));
+          throw new Error(data.error || 'Search failed');
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+          const { done, value } = await reader.read();
+          if (done) break;
+
+          buffer += decoder.decode(value, { stream: true });
+          const lines = buffer.split('\n');
+          buffer = lines.pop() ?? '';
+
+          for (const line of lines) {
+            if (!line.trim()) continue;
+            const event = JSON.parse(line);
+
+            if (event.type === 'results' && event.results.length > 0) {
+              setProducts(prev => [...prev, ...event.results.map(formatProduct)]);
+            } else if (event.type === 'error') {
+              throw new Error(event.error || 'Search failed');
+            }
+          }
+        }
       }
+
+      await bingSearch;
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to search products');
       setProducts([]);
@@ -183,15 +206,6 @@ export default function ProductSearch({
     return products;
   }, [products, bingResults, selectedSeller, searchTriggered]);
 
-  const formatPrice = (price: string | number): number => {
-    if (typeof price === 'number') return price;
-    if (typeof price === 'string') {
-      const numericValue = parseFloat(price.replace(/[^\d.]/g, ''));
-      return isNaN(numericValue) ? 0 : numericValue;
-    }
-    return 0;
-  };
-
   const detectCategory = (title: string): string => {
     if (!title) return 'Other';
     
@@ -215,7 +229,7 @@ export default function ProductSearch({
       category: product.category || detectCategory(product.title),
       name: product.title,
       brand: product.brand || extractBrandFromTitle(product.title),
-      price: formatPrice(product.price),
+      price: product.price ?? 0,
       link: product.link,
       warranty: product.warranty || '1 year'
     };
@@ -277,12 +291,14 @@ export default function ProductSearch({
         <div className="text-red-500 text-sm mb-4">{error}</div>
       )}
 
-      {loading ? (
+      {loading && (
         <div className="flex justify-center items-center py-4">
           <RefreshCw className="animate-spin mr-2" />
           <span>Searching...</span>
         </div>
-      ) : searchTriggered && combinedResults.length > 0 ? (
+      )}
+
+      {searchTriggered && combinedResults.length > 0 ? (
         <div className="space-y-3 max-h-96 overflow-y-auto">
           {combinedResults.map((product, index) => (
             <div key={index} className="p-3 border rounded hover:bg-gray-50">
@@ -303,7 +319,9 @@ export default function ProductSearch({
                   </div>
                   <h4 className="font-medium">{product.title}</h4>
                   <div className="text-lg font-bold text-green-600">
-                    ₹{formatPrice(product.price).toLocaleString('en-IN')}
+                    {product.price !== null
+                      ? `₹${product.price.toLocaleString('en-IN')}`
+                      : 'Price unavailable'}
                   </div>
                   {product.warranty && (
                     <div className="text-sm text-gray-600">Warranty: {product.warranty}</div>
@@ -332,7 +350,7 @@ export default function ProductSearch({
             </div>
           ))}
         </div>
-      ) : searchTriggered && query ? (
+      ) : searchTriggered && query && !loading ? (
         <div className="text-center py-4 text-gray-500">
           No products found for "{query}"
         </div>